@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 import logging
 
 from .jvcprojector.device import JvcProjectorAuthError
@@ -13,14 +14,19 @@ from homeassistant.const import (
     CONF_HOST,
     CONF_PASSWORD,
     CONF_PORT,
-    EVENT_HOMEASSISTANT_STOP,
     Platform,
 )
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 
 from typing import TypeAlias
 
+from .const import (
+    CONNECT_TIMEOUT,
+    DATA_PENDING_DEVICES,
+    DISCONNECT_TIMEOUT,
+    DOMAIN,
+)
 from .coordinator import JvcProjectorDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,72 +47,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: JVCConfigEntry) -> bool:
     """Set up integration from a config entry."""
     host = entry.data[CONF_HOST]
 
-    # Create new device and coordinator
-    device = JvcProjector(
-        host=host,
-        port=entry.data[CONF_PORT],
-        password=entry.data[CONF_PASSWORD],
+    # Reuse the device the config flow has just probed, otherwise connect
+    device: JvcProjector | None = (
+        hass.data.get(DOMAIN, {}).get(DATA_PENDING_DEVICES, {}).pop(host, None)
     )
-
-    # Initial connection with proper cleanup on failure
-    try:
-        _LOGGER.debug("Setting up JVC Projector at %s", host)
-        await asyncio.wait_for(device.connect(True), timeout=30)
-    except asyncio.TimeoutError:
-        _LOGGER.error("Timeout connecting to %s during setup", host)
-        await device.disconnect()
-        raise ConfigEntryNotReady(f"Connection timeout to {host}")
-    except JvcProjectorConnectError as err:
-        _LOGGER.error("Failed to connect to %s during setup: %s", host, err)
-        await device.disconnect()
-        raise ConfigEntryNotReady(f"Unable to connect to {host}") from err
-    except JvcProjectorAuthError as err:
-        _LOGGER.error("Authentication failed for %s", host)
-        await device.disconnect()
-        raise ConfigEntryAuthFailed("Password authentication failed") from err
-    except Exception as err:
-        _LOGGER.error("Unexpected error setting up %s: %s", host, err, exc_info=True)
-        await device.disconnect()
-        raise ConfigEntryNotReady(f"Unexpected error connecting to {host}") from err
+    if device is None:
+        device = JvcProjector(
+            host=host,
+            port=entry.data[CONF_PORT],
+            password=entry.data[CONF_PASSWORD],
+            persistent=True,
+        )
+        await _async_connect_device(device, host)
+    else:
+        _LOGGER.debug("Reusing device probed by the config flow for %s", host)
 
     # Create coordinator
     coordinator = JvcProjectorDataUpdateCoordinator(hass, device)
     entry.runtime_data = coordinator
 
-    # Do initial data fetch
+    # Do initial data fetch while the platforms are set up; entities report
+    # unavailable until the first poll lands
+    refresh_task = hass.async_create_task(
+        coordinator.async_config_entry_first_refresh()
+    )
     try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.error("Failed initial data fetch for %s: %s", host, err, exc_info=True)
-        # Clean up on failure
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except BaseException:
+        # Stop the initial fetch so it cannot keep polling after a failed setup
+        refresh_task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await refresh_task
         await coordinator.async_shutdown()
         raise
 
-    # Setup disconnect handler
-    async def disconnect_on_stop(event: Event) -> None:
-        """Disconnect when Home Assistant stops."""
-        _LOGGER.debug("Home Assistant stopping, disconnecting from %s", host)
+    try:
+        await refresh_task
+    except Exception as err:
+        # Home Assistant reports the resulting setup retry itself
+        _LOGGER.debug("Failed initial data fetch for %s: %s", host, err)
+        # Clean up on failure
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         await coordinator.async_shutdown()
+        raise
 
-    # Setup unload handler
+    # Setup unload handler (entries are also unloaded when Home Assistant stops)
     async def disconnect_on_unload() -> None:
         """Disconnect when entry is unloaded."""
         _LOGGER.debug("Entry unloading, disconnecting from %s", host)
         await coordinator.async_shutdown()
 
-    # Register cleanup handlers
-    entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, disconnect_on_stop)
-    )
     entry.async_on_unload(disconnect_on_unload)
 
-    # Setup platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
     _LOGGER.debug("Successfully set up JVC Projector at %s", host)
     return True
 
 
+async def _async_connect_device(device: JvcProjector, host: str) -> None:
+    """Connect and read device info, mapping failures to setup errors."""
+    try:
+        _LOGGER.debug("Setting up JVC Projector at %s", host)
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            await device.connect(True)
+    except Exception as err:
+        # A failed connect has normally closed the socket already; bound the
+        # cleanup so a hung disconnect cannot block ConfigEntryNotReady
+        with suppress(Exception):
+            async with asyncio.timeout(DISCONNECT_TIMEOUT):
+                await asyncio.shield(device.disconnect())
+
+        if isinstance(err, TimeoutError):
+            _LOGGER.error("Timeout connecting to %s during setup", host)
+            raise ConfigEntryNotReady(f"Connection timeout to {host}") from err
+        if isinstance(err, JvcProjectorConnectError):
+            _LOGGER.error("Failed to connect to %s during setup: %s", host, err)
+            raise ConfigEntryNotReady(f"Unable to connect to {host}") from err
+        if isinstance(err, JvcProjectorAuthError):
+            _LOGGER.error("Authentication failed for %s", host)
+            raise ConfigEntryAuthFailed("Password authentication failed") from err
+        _LOGGER.exception("Unexpected error setting up %s", host)
+        raise ConfigEntryNotReady(f"Unexpected error connecting to {host}") from err
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: JVCConfigEntry) -> bool:
     """Unload config entry."""
     host = entry.data[CONF_HOST]
@@ -13,7 +13,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import JVCConfigEntry, JvcProjectorDataUpdateCoordinator
@@ -27,6 +27,19 @@ class JVCBinarySensorEntityDescription(BinarySensorEntityDescription):
     value_fn: Callable[[str | None], bool | None]
 
 
+_POWER_ON_SET = frozenset({const.ON, const.WARMING})
+
+
+def _power_on(value: str | None) -> bool | None:
+    """Return if the projector is powered (ON or WARMING)."""
+    return value in _POWER_ON_SET if value else None
+
+
+def _signal_present(value: str | None) -> bool | None:
+    """Return if the projector reports an input signal."""
+    return value == const.SIGNAL if value else None
+
+
 JVC_BINARY_SENSORS = (
     # Projector powered (ON or WARMING)
     # Disabled by default - redundant with remote.jvc_projector and sensor.jvc_projector_power_state
@@ -36,7 +49,7 @@ JVC_BINARY_SENSORS = (
         device_class=BinarySensorDeviceClass.POWER,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda v: v in (const.ON, const.WARMING) if v else None,
+        value_fn=_power_on,
     ),
     # Input signal present
     # Disabled by default - redundant with sensor.jvc_projector_source_display
@@ -46,7 +59,7 @@ JVC_BINARY_SENSORS = (
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda v: v == const.SIGNAL if v else None,
+        value_fn=_signal_present,
     ),
 )
 
@@ -60,7 +73,10 @@ async def async_setup_entry(
     coordinator: JvcProjectorDataUpdateCoordinator = entry.runtime_data
 
     async_add_entities(
-        JvcBinarySensor(coordinator, description) for description in JVC_BINARY_SENSORS
+        [
+            JvcBinarySensor(coordinator, description)
+            for description in JVC_BINARY_SENSORS
+        ]
     )
 
 
@@ -77,8 +93,16 @@ class JvcBinarySensor(JvcProjectorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
-
-    @property
-    def is_on(self) -> bool | None:
-        value = self.coordinator.data.get(self.entity_description.key)
-        return self.entity_description.value_fn(value)
+        self._key = description.key
+        self._value_fn = description.value_fn
+        self._update_is_on()
+
+    def _update_is_on(self) -> None:
+        """Evaluate the predicate once per coordinator update."""
+        self._attr_is_on = self._value_fn((self.coordinator.data or {}).get(self._key))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_is_on()
+        super()._handle_coordinator_update()
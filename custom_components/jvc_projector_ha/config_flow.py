@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Mapping
+from contextlib import suppress
 import logging
 from typing import Any
 
@@ -13,16 +14,15 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.util.network import is_host_valid
 
 from . import JVCConfigEntry
-from .const import DOMAIN, NAME
+from .const import CONNECT_TIMEOUT, DATA_PENDING_DEVICES, DOMAIN, NAME
 
 _LOGGER = logging.getLogger(__name__)
 
-CONNECTION_TIMEOUT = 30  # seconds
-
 
 class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow for the JVC Projector integration."""
@@ -30,6 +30,7 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
     _reauth_entry: JVCConfigEntry | None = None
+    _pending: tuple[str, JvcProjector] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -42,14 +43,26 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
             port = user_input[CONF_PORT]
             password = user_input.get(CONF_PASSWORD)
 
+            # Host already belongs to an entry - update it without probing
+            for entry in self._async_current_entries():
+                if entry.unique_id and entry.data.get(CONF_HOST) == host:
+                    await self.async_set_unique_id(entry.unique_id)
+                    self._abort_if_unique_id_configured(
+                        updates={
+                            CONF_HOST: host,
+                            CONF_PORT: port,
+                            CONF_PASSWORD: password,
+                        }
+                    )
+
             try:
                 if not is_host_valid(host):
                     raise InvalidHost  # noqa: TRY301
 
-                mac = await get_mac_address(host, port, password)
+                device = await get_device(host, port, password)
             except InvalidHost:
                 errors["base"] = "invalid_host"
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 errors["base"] = "cannot_connect"
                 _LOGGER.error("Timeout connecting to %s:%d", host, port)
             except JvcProjectorConnectError as err:
@@ -62,17 +75,12 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
                     host,
                     port,
                 )
-            except Exception as err:
+            except Exception:
                 errors["base"] = "unknown"
-                _LOGGER.error(
-                    "Unexpected error connecting to %s:%d - %s",
-                    host,
-                    port,
-                    err,
-                    exc_info=True,
-                )
+                _LOGGER.exception("Unexpected error connecting to %s:%d", host, port)
             else:
-                await self.async_set_unique_id(format_mac(mac))
+                mac = format_mac(device.mac)
+                await self.async_set_unique_id(mac)
                 self._abort_if_unique_id_configured(
                     updates={CONF_HOST: host, CONF_PORT: port, CONF_PASSWORD: password}
                 )
@@ -81,9 +89,17 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
                     "Successfully configured JVC Projector at %s:%d (MAC: %s)",
                     host,
                     port,
-                    format_mac(mac),
+                    mac,
                 )
 
+                # Hand the probed device to async_setup_entry so it does not
+                # have to connect and read the model/MAC again. Stored only now,
+                # past every abort; async_remove drops it if setup never runs.
+                self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                    DATA_PENDING_DEVICES, {}
+                )[host] = device
+                self._pending = (host, device)
+
                 return self.async_create_entry(
                     title=NAME,
                     data={
@@ -105,6 +121,17 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Drop the probed device if setup did not pick it up."""
+        if self._pending is None:
+            return
+        host, device = self._pending
+        self._pending = None
+        pending = self.hass.data.get(DOMAIN, {}).get(DATA_PENDING_DEVICES, {})
+        if pending.get(host) is device:
+            del pending[host]
+
     async def async_step_reauth(
         self, user_input: Mapping[str, Any]
     ) -> ConfigFlowResult:
@@ -128,8 +155,9 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
             password = user_input[CONF_PASSWORD]
 
             try:
-                await get_mac_address(host, port, password)
-            except asyncio.TimeoutError:
+                # A successful auth handshake is enough; the MAC is already known
+                await validate_connection(host, port, password)
+            except TimeoutError:
                 errors["base"] = "cannot_connect"
                 _LOGGER.error("Timeout connecting to %s:%d during reauth", host, port)
             except JvcProjectorConnectError as err:
@@ -142,14 +170,10 @@ class JvcProjectorConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.error(
                     "Authentication failed for %s:%d during reauth", host, port
                 )
-            except Exception as err:
+            except Exception:
                 errors["base"] = "unknown"
-                _LOGGER.error(
-                    "Unexpected error during reauth for %s:%d - %s",
-                    host,
-                    port,
-                    err,
-                    exc_info=True,
+                _LOGGER.exception(
+                    "Unexpected error during reauth for %s:%d", host, port
                 )
             else:
                 self.hass.config_entries.async_update_entry(
@@ -170,39 +194,48 @@ class InvalidHost(Exception):
     """Error indicating invalid network host."""
 
 
-async def get_mac_address(host: str, port: int, password: str | None) -> str:
-    """Get device mac address for config flow with proper error handling."""
+async def validate_connection(host: str, port: int, password: str | None) -> None:
+    """Check that the projector accepts a connection with the given password."""
     device = JvcProjector(host, port=port, password=password)
 
+    _LOGGER.debug("Validating connection to %s:%d", host, port)
+
+    try:
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            await device.connect()
+    finally:
+        with suppress(Exception):
+            await device.disconnect()
+
+
+async def get_device(host: str, port: int, password: str | None) -> JvcProjector:
+    """Probe the device for config flow with proper error handling.
+
+    Returns the disconnected device with its model and MAC address cached.
+    """
+    device = JvcProjector(host, port=port, password=password, persistent=True)
+
     _LOGGER.debug("Attempting to get MAC address from %s:%d", host, port)
 
     try:
         # Add timeout to prevent hanging
-        await asyncio.wait_for(device.connect(True), timeout=CONNECTION_TIMEOUT)
+        async with asyncio.timeout(CONNECT_TIMEOUT):
+            await device.connect(True)
 
         if not device.mac:
             raise JvcProjectorConnectError("Device did not provide MAC address")
 
         _LOGGER.debug("Successfully retrieved MAC address from %s:%d", host, port)
-        return device.mac
+        return device
 
-    except asyncio.TimeoutError:
+    except TimeoutError:
         _LOGGER.error("Timeout getting MAC address from %s:%d", host, port)
         raise
     except Exception as err:
-        _LOGGER.error(
-            "Error getting MAC address from %s:%d - %s", host, port, err, exc_info=True
-        )
+        # The caller reports the failure to the user and logs it
+        _LOGGER.debug("Error getting MAC address from %s:%d - %s", host, port, err)
         raise
     finally:
         # Always try to disconnect, even if connection failed
-        try:
+        with suppress(Exception):
             await device.disconnect()
-            _LOGGER.debug("Disconnected from %s:%d after MAC retrieval", host, port)
-        except Exception as err:
-            _LOGGER.debug(
-                "Error disconnecting from %s:%d after MAC retrieval - %s",
-                host,
-                port,
-                err,
-            )
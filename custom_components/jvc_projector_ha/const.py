@@ -6,6 +6,15 @@ NAME = "JVC Projector"
 DOMAIN = "jvc_projector_ha"
 MANUFACTURER = "JVC"
 
+# hass.data[DOMAIN] key for devices probed by the config flow, keyed by host
+DATA_PENDING_DEVICES = "pending"
+
+# Upper bound for connecting and authenticating with the projector
+CONNECT_TIMEOUT = 30  # seconds
+
+# Upper bound for closing a session during cleanup
+DISCONNECT_TIMEOUT = 5  # seconds
+
 # Model name mapping from internal codes to product names
 MODEL_MAPPING = {
     "ILAFPJ -- D8A1": "DLA-NZ700",
@@ -59,3 +68,13 @@ REMOTE_COMMANDS = {
     "cmd": pj.REMOTE_CMD,
     "3d_format": pj.REMOTE_3D_FORMAT,
 }
+
+# Every accepted spelling of a remote button ("menu", "remote_menu"; matched
+# lowercased) resolved once to its (button name, key code)
+RESOLVED_REMOTE_CODES: dict[str, tuple[str, str]] = {
+    alias: (name, code)
+    for name, code in pj.REMOTE_BUTTON_MAP.items()
+    for alias in (name, f"remote_{name}")
+}
+
+HEX_DIGITS = "0123456789ABCDEFabcdef"
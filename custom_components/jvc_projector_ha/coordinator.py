@@ -3,33 +3,96 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from contextlib import suppress
+from datetime import datetime, timedelta
 import logging
 
 from collections.abc import Mapping
+from operator import itemgetter
 
 from .jvcprojector.device import JvcProjectorAuthError
-from .jvcprojector.projector import JvcProjector, JvcProjectorConnectError, const
+from .jvcprojector.projector import (
+    UNKNOWN_MODEL,
+    JvcProjector,
+    JvcProjectorConnectError,
+    const,
+)
 from .jvcprojector import command  # 2024 spec
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.device_registry import (
+    CONNECTION_NETWORK_MAC,
+    DeviceInfo,
+    async_get as async_get_device_registry,
+    format_mac,
+)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import NAME
+from .const import (
+    DISCONNECT_TIMEOUT,
+    DOMAIN,
+    MANUFACTURER,
+    NAME,
+    decode_model,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 # Conservative polling interval — projectors are slow devices
 UPDATE_INTERVAL = timedelta(seconds=10)
 
+# Polling interval while in standby. Only power-on matters then, so state
+# changes may take up to this long to show up.
+IDLE_UPDATE_INTERVAL = timedelta(seconds=60)
+
+# One-off short interval after a command, so its effect shows up quickly
+BOOST_UPDATE_INTERVAL = timedelta(seconds=2)
+
 # Hard timeout for any single poll
 POLL_TIMEOUT = 30  # seconds
 
+# References left unanswered this many polls in a row are skipped for a while
+UNSUPPORTED_AFTER_MISSES = 3
+UNSUPPORTED_BACKOFF = 3600  # seconds
+
+# Close the held session if no poll has run for this long (e.g. polling paused
+# because no entity is listening). Must exceed IDLE_UPDATE_INTERVAL.
+SESSION_IDLE_TIMEOUT = 300  # seconds
+
+# Keys summarised in the per-poll debug log
+_STATE_LOG_KEYS = (
+    const.POWER,
+    const.INPUT,
+    const.SOURCE,
+    const.IFLT,
+    const.IFIS,
+    const.PMPM,
+)
+_STATE_LOG_DEFAULTS = dict.fromkeys(_STATE_LOG_KEYS)
+_state_log_values = itemgetter(*_STATE_LOG_KEYS)
+
+# References polled while the projector is ON, as (command, result key).
+# Content Type (PMCT) is not polled: nothing uses it (PMAT is used instead).
+_ON_REFS = (
+    (command.IFLT, const.IFLT),  # Light Source Time
+    (command.IFIS, const.IFIS),  # Source Display
+    (command.PMPM, const.PMPM),  # Picture Mode
+    (command.IFIN, const.IFIN),  # Input Display
+    (command.PMAT, const.auto_content_type),  # Auto transition for Content Type
+)
+
+# Not supported by every model, so batched separately and only logged at debug
+_OPTIONAL_ON_REFS = (
+    (command.IFCM, const.IFCM),  # Colorimetry
+    (command.PMCV, const.PMCV),  # LD Current Value
+    (command.PMDC, const.PMDC),  # Dynamic Control
+)
+
 
 class JvcProjectorDataUpdateCoordinator(DataUpdateCoordinator[dict[str, str]]):
     """Coordinator for JVC Projector state (2024 spec)."""
@@ -40,14 +103,27 @@ class JvcProjectorDataUpdateCoordinator(DataUpdateCoordinator[dict[str, str]]):
             logger=_LOGGER,
             name=NAME,
             update_interval=UPDATE_INTERVAL,
+            # Unchanged polls (e.g. steady standby) don't rewrite entity state
+            always_update=False,
         )
 
         self.device = device
         self.unique_id = format_mac(device.mac)
+        self.device_info = self._build_device_info()
 
         # Shared lock to prevent remote commands and polling from conflicting
         self.command_lock = asyncio.Lock()
 
+        # The projector session is held open between polls and only
+        # re-established after a failure
+        self._connected = False
+        self._idle_unsub: CALLBACK_TYPE | None = None
+
+        # Consecutive unanswered polls per reference code, and the loop time
+        # until which a code that keeps going unanswered is not sent
+        self._ref_misses: dict[str, int] = {}
+        self._unsupported_until: dict[str, float] = {}
+
         _LOGGER.debug(
             "Initialized JVC Projector coordinator for %s (%s)",
             device.host,
@@ -57,339 +133,273 @@ class JvcProjectorDataUpdateCoordinator(DataUpdateCoordinator[dict[str, str]]):
     async def _async_update_data(self) -> Mapping[str, str | int | None]:
         """Fetch state from the projector.
 
-        One connect → one poll → disconnect.
+        Reuses the open session; reconnects only after a failed poll.
         """
-        _LOGGER.debug("Polling state from %s", self.device.host)
+        host = self.device.host
+        _LOGGER.debug("Polling state from %s", host)
+
+        # Each poll pushes back the idle disconnect
+        self._cancel_idle_timer()
+        self._idle_unsub = async_call_later(
+            self.hass, SESSION_IDLE_TIMEOUT, self._async_idle_disconnect
+        )
 
         # Use the shared lock to prevent conflicts with remote commands
         async with self.command_lock:
             try:
-                # Connect only for this poll
-                await asyncio.wait_for(
-                    self.device.connect(get_info=False),
-                    timeout=POLL_TIMEOUT,
-                )
-
-                # Base state (PW, IP, SOURCE)
-                state = await asyncio.wait_for(
-                    self.device.get_state(),
-                    timeout=POLL_TIMEOUT,
-                )
-
-                # Filter out None values
-                result: dict[str, str | int] = {
-                    k: v for k, v in state.items() if v is not None
-                }
-
-                # --- Model (MD) ---
-                # Fetch once - only if not already cached (doesn't change)
-                if not self.data or not self.data.get(const.MODEL):
-                    try:
-                        raw_model = await asyncio.wait_for(
-                            self.device.ref(command.MODEL),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_model:
-                            result[const.MODEL] = raw_model
+                # One bound for the whole poll; single silent references are
+                # skipped by the device's own read timeouts
+                async with asyncio.timeout(POLL_TIMEOUT):
+                    if not self._connected:
+                        await self.device.connect(get_info=False)
+                        self._connected = True
+
+                    # Base state (PW, IP, SOURCE)
+                    result: dict[str, str | int] = await self.device.get_state()
+
+                    # --- Model (MD) ---
+                    # Fetch once - only if not already cached (doesn't change)
+                    if not self.data or not self.data.get(const.MODEL):
+                        try:
+                            raw_model = await self.device.ref(command.MODEL)
+                            if raw_model:
+                                result[const.MODEL] = raw_model
+                                if "model" not in self.device_info:
+                                    self._async_set_device_model(raw_model)
+                                _LOGGER.debug(
+                                    "MD response for %s: %s",
+                                    host,
+                                    raw_model,
+                                )
+                        except Exception as err:
                             _LOGGER.debug(
-                                "MD response for %s: %s",
-                                self.device.host,
-                                raw_model,
+                                "MD error for %s: %s",
+                                host,
+                                err,
                             )
-                    except asyncio.TimeoutError:
-                        _LOGGER.debug(
-                            "MD timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "MD error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
-                else:
-                    # Preserve model from previous data
-                    result[const.MODEL] = self.data[const.MODEL]
-
-                power = result.get(const.POWER)
-
-                # --- Light Source Time (IFLT) ---
-                # Only valid when projector is ON
-                if power == const.ON:
-                    try:
-                        raw_light_time = await asyncio.wait_for(
-                            self.device.ref(command.IFLT),
-                            timeout=POLL_TIMEOUT,
+                    else:
+                        # Preserve model from previous data
+                        result[const.MODEL] = self.data[const.MODEL]
+
+                    power = result.get(const.POWER)
+
+                    # Picked up by the coordinator when it schedules the next poll
+                    interval = (
+                        IDLE_UPDATE_INTERVAL
+                        if power == const.STANDBY
+                        else UPDATE_INTERVAL
+                    )
+                    if self.update_interval != interval:
+                        self.update_interval = interval
+
+                    # Only valid when projector is ON
+                    if power == const.ON:
+                        # Independent references, sent as batches so they share
+                        # a device exchange instead of one round trip each
+                        raw = await self._async_pipeline(
+                            host, _ON_REFS, logging.WARNING
                         )
-                        _LOGGER.debug(
-                            "IFLT response for %s: %s (type: %s)",
-                            self.device.host,
-                            raw_light_time,
-                            type(raw_light_time).__name__,
+                        raw |= await self._async_pipeline(
+                            host, _OPTIONAL_ON_REFS, logging.DEBUG
                         )
-                        if raw_light_time and raw_light_time.isdigit():
+
+                        # --- Light Source Time (IFLT) ---
+                        raw_light_time = raw.pop(const.IFLT, None)
+                        try:
                             result[const.IFLT] = int(raw_light_time)
-                        elif raw_light_time:
+                        except TypeError:
+                            pass
+                        except ValueError:
                             _LOGGER.warning(
                                 "IFLT response not numeric for %s: '%s'",
-                                self.device.host,
+                                host,
                                 raw_light_time,
                             )
-                    except Exception as err:
-                        _LOGGER.warning(
-                            "IFLT error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
 
-                    # --- Source Display (IFIS) ---
-                    try:
-                        raw_source_display = await asyncio.wait_for(
-                            self.device.ref(command.IFIS),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_source_display:
-                            result[const.IFIS] = raw_source_display
-                    except asyncio.TimeoutError:
+                        result |= raw
+                    else:
+                        # Projector is off → skip IFLT poll, show power_off state
+                        result[const.IFLT] = "power_off"
                         _LOGGER.debug(
-                            "IFIS timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "IFIS unavailable while on for %s: %s",
-                            self.device.host,
-                            err,
+                            "Skipping IFLT poll for %s (power=%s)",
+                            host,
+                            power,
                         )
 
-                    # --- Input Display (IFIN) ---
-                    try:
-                        raw_input_display = await asyncio.wait_for(
-                            self.device.ref(command.IFIN),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_input_display:
-                            result[const.IFIN] = raw_input_display
-                            _LOGGER.debug(
-                                "IFIN response for %s: %s",
-                                self.device.host,
-                                raw_input_display,
-                            )
-                    except asyncio.TimeoutError:
-                        _LOGGER.warning(
-                            "IFIN timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.warning(
-                            "IFIN error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
-
-                    # --- Colorimetry (IFCM) ---
-                    try:
-                        raw_colorimetry = await asyncio.wait_for(
-                            self.device.ref(command.IFCM),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_colorimetry:
-                            result[const.IFCM] = raw_colorimetry
-                            _LOGGER.debug(
-                                "IFCM response for %s: %s",
-                                self.device.host,
-                                raw_colorimetry,
-                            )
-                    except asyncio.TimeoutError:
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug(
-                            "IFCM timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "IFCM error for %s: %s",
-                            self.device.host,
-                            err,
+                            "State from %s: power=%s input=%s signal=%s iflt=%s ifis=%s picture_mode=%s",
+                            host,
+                            *_state_log_values(_STATE_LOG_DEFAULTS | result),
                         )
 
-                    # --- Content Type (PMCT) ---
-                    # COMMENTED OUT: Not used by any sensor or control (using PMAT instead)
-                    # try:
-                    #     raw_content_type = await asyncio.wait_for(
-                    #         self.device.ref(command.PMCT),
-                    #         timeout=POLL_TIMEOUT,
-                    #     )
-                    #     if raw_content_type:
-                    #         result[const.PMCT] = raw_content_type
-                    #         _LOGGER.debug(
-                    #             "PMCT response for %s: %s",
-                    #             self.device.host,
-                    #             raw_content_type,
-                    #         )
-                    # except asyncio.TimeoutError:
-                    #     _LOGGER.warning(
-                    #         "PMCT timeout for %s - command may not be supported or projector is busy",
-                    #         self.device.host,
-                    #     )
-                    # except Exception as err:
-                    #     _LOGGER.warning(
-                    #         "PMCT error for %s: %s",
-                    #         self.device.host,
-                    #         err,
-                    #     )
-
-                    # Store content type in diagnostic key too for comparison
-                    # if const.PMCT in result:
-                    #     result[const.PMCT + "_diagnostic"] = result[const.PMCT]
-
-                    # --- Auto transition value for Content Type (PMAT) ---
-                    try:
-                        raw_auto_content_type = await asyncio.wait_for(
-                            self.device.ref(command.PMAT),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_auto_content_type:
-                            result[const.auto_content_type] = raw_auto_content_type
-                            _LOGGER.debug(
-                                "PMAT response for %s: %s",
-                                self.device.host,
-                                raw_auto_content_type,
-                            )
-                    except asyncio.TimeoutError:
-                        _LOGGER.warning(
-                            "PMAT timeout for %s - command may not be supported or projector is busy",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.warning(
-                            "PMAT error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
+                    return result
 
-                    # --- LD Current Value (PMCV) ---
-                    try:
-                        raw_ld_current = await asyncio.wait_for(
-                            self.device.ref(command.PMCV),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_ld_current is not None:
-                            result[const.PMCV] = raw_ld_current
-                            _LOGGER.debug(
-                                "PMCV response for %s: %s",
-                                self.device.host,
-                                raw_ld_current,
-                            )
-                    except asyncio.TimeoutError:
-                        _LOGGER.debug(
-                            "PMCV timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "PMCV error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
-
-                    # --- Dynamic Control (PMDC) ---
-                    try:
-                        raw_dynamic_ctrl = await asyncio.wait_for(
-                            self.device.ref(command.PMDC),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_dynamic_ctrl:
-                            result[const.PMDC] = raw_dynamic_ctrl
-                            _LOGGER.debug(
-                                "PMDC response for %s: %s",
-                                self.device.host,
-                                raw_dynamic_ctrl,
-                            )
-                    except asyncio.TimeoutError:
-                        _LOGGER.debug(
-                            "PMDC timeout for %s",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "PMDC error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
-
-                    # --- Picture Mode (PMPM) ---
-                    # Reference command: just "PMPM" per spec, projector responds with PM + 2-byte parameter
-                    try:
-                        raw_picture_mode = await asyncio.wait_for(
-                            self.device.ref(command.PMPM),
-                            timeout=POLL_TIMEOUT,
-                        )
-                        if raw_picture_mode:
-                            result[const.PMPM] = raw_picture_mode
-                            _LOGGER.debug(
-                                "PMPM response for %s: %s",
-                                self.device.host,
-                                raw_picture_mode,
-                            )
-                    except asyncio.TimeoutError:
-                        _LOGGER.warning(
-                            "PMPM timeout for %s - command may not be supported or projector is busy",
-                            self.device.host,
-                        )
-                    except Exception as err:
-                        _LOGGER.warning(
-                            "PMPM error for %s: %s",
-                            self.device.host,
-                            err,
-                        )
-                else:
-                    # Projector is off → skip IFLT poll, show power_off state
-                    result[const.IFLT] = "power_off"
-                    _LOGGER.debug(
-                        "Skipping IFLT poll for %s (power=%s)",
-                        self.device.host,
-                        power,
-                    )
-
-                _LOGGER.debug(
-                    "State from %s: power=%s input=%s signal=%s iflt=%s ifis=%s picture_mode=%s",
-                    self.device.host,
-                    result.get(const.POWER),
-                    result.get(const.INPUT),
-                    result.get(const.SOURCE),
-                    result.get(const.IFLT),
-                    result.get(const.IFIS),
-                    result.get(const.PMPM),
-                )
-
-                return result
-
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Timeout polling %s", self.device.host)
+            # Failed polls are summarised by the coordinator as UpdateFailed
+            except TimeoutError:
+                _LOGGER.debug("Timeout polling %s", host)
+                await self._async_disconnect()
                 raise UpdateFailed("Timeout polling projector")
 
             except JvcProjectorAuthError as err:
-                _LOGGER.error("Authentication failed for %s", self.device.host)
+                _LOGGER.error("Authentication failed for %s", host)
+                await self._async_disconnect()
                 raise ConfigEntryAuthFailed("Password authentication failed") from err
 
             except JvcProjectorConnectError as err:
-                _LOGGER.warning(
-                    "Connection error polling %s: %s", self.device.host, err
-                )
+                _LOGGER.debug("Connection error polling %s: %s", host, err)
+                await self._async_disconnect()
                 raise UpdateFailed("Connection error polling projector") from err
 
             except Exception as err:
-                _LOGGER.error(
-                    "Unexpected error polling %s: %s",
-                    self.device.host,
-                    err,
-                    exc_info=True,
-                )
+                _LOGGER.exception("Unexpected error polling %s", host)
+                await self._async_disconnect()
                 raise UpdateFailed(f"Unexpected error: {err}")
 
             finally:
-                # Always disconnect — projector prefers short sessions
-                try:
-                    await self.device.disconnect()
-                except Exception:
-                    pass
+                # A boost lasts one poll; a failed one must not keep the
+                # short interval and retry an unreachable projector every 2 s
+                if self.update_interval == BOOST_UPDATE_INTERVAL:
+                    self.update_interval = UPDATE_INTERVAL
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and close the projector session."""
+        await super().async_shutdown()
+        self._cancel_idle_timer()
+        await self._async_disconnect()
+
+    def _build_device_info(self) -> DeviceInfo:
+        """Build the DeviceInfo shared by all entities of this projector."""
+        # Build DeviceInfo defensively — nothing here should ever raise
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.unique_id)},
+            name=NAME,
+            manufacturer=MANUFACTURER,
+            connections={(CONNECTION_NETWORK_MAC, self.device.mac)},
+        )
+
+        # Optional fields — populate only if available. The model was read
+        # during setup (or by the config flow); if the projector did not
+        # report it then, the first poll that reads it fills it in.
+        raw_model = self.device.model
+        if raw_model and raw_model != UNKNOWN_MODEL:
+            device_info["model"] = decode_model(raw_model)
+
+        if version := self.device.version:
+            device_info["sw_version"] = version
+
+        return device_info
+
+    @callback
+    def _async_set_device_model(self, raw_model: str) -> None:
+        """Record a model that was not known when the device info was built."""
+        model = decode_model(raw_model)
+        self.device_info["model"] = model
+        registry = async_get_device_registry(self.hass)
+        if entry := registry.async_get_device(identifiers={(DOMAIN, self.unique_id)}):
+            registry.async_update_device(entry.id, model=model)
+
+    @callback
+    def async_set_optimistic(self, key: str, value: str | int) -> None:
+        """Push the value a command is expected to produce, then poll soon.
+
+        Entities update without waiting for a poll round trip; the boosted
+        poll reconciles with the projector.
+        """
+        if self.data is not None:
+            self.async_set_updated_data(self.data | {key: value})
+        self.boost_next_poll()
+
+    @callback
+    def boost_next_poll(self) -> None:
+        """Poll again shortly after a command that changes projector state.
+
+        The next poll, successful or not, restores the normal interval.
+        """
+        self.update_interval = BOOST_UPDATE_INTERVAL
+        self._schedule_refresh()
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel the pending idle disconnect, if any."""
+        if self._idle_unsub is not None:
+            self._idle_unsub()
+            self._idle_unsub = None
+
+    async def _async_idle_disconnect(self, _now: datetime) -> None:
+        """Close a session that has not been polled for SESSION_IDLE_TIMEOUT."""
+        self._idle_unsub = None
+        async with self.command_lock:
+            if self._connected:
+                _LOGGER.debug("Closing idle session to %s", self.device.host)
+                await self._async_disconnect()
+
+    async def _async_pipeline(
+        self, host: str, refs: tuple[tuple[str, str], ...], level: int
+    ) -> dict[str, str]:
+        """Send a batch of references, returning the non-empty responses.
+
+        A failed batch is logged at the given level and yields no values.
+        References in their unsupported backoff window are left out.
+        """
+        now = self.hass.loop.time()
+        refs = tuple(
+            ref for ref in refs if self._unsupported_until.get(ref[0], 0) <= now
+        )
+        if not refs:
+            return {}
+
+        codes = [code for code, _ in refs]
+        unanswered: list[str] = []
+        try:
+            responses = await self.device.pipeline(codes, unanswered)
+        except asyncio.CancelledError:
+            # The poll timed out mid-batch; still count what went unanswered
+            for code in unanswered:
+                self._note_ref_miss(host, code, now)
+            raise
+        except Exception as err:
+            _LOGGER.log(level, "%s error for %s: %s", "/".join(codes), host, err)
+            return {}
+
+        values: dict[str, str] = {}
+        for (code, key), response in zip(refs, responses, strict=True):
+            if response is None:
+                self._note_ref_miss(host, code, now)
+                continue
+            self._ref_misses.pop(code, None)
+            if response:
+                values[key] = response
+                _LOGGER.debug("%s response for %s: %s", code, host, response)
+        return values
+
+    def _note_ref_miss(self, host: str, code: str, now: float) -> None:
+        """Count an unanswered reference and back off once it keeps failing."""
+        misses = self._ref_misses.get(code, 0) + 1
+        if misses < UNSUPPORTED_AFTER_MISSES:
+            self._ref_misses[code] = misses
+            return
+
+        del self._ref_misses[code]
+        self._unsupported_until[code] = now + UNSUPPORTED_BACKOFF
+        _LOGGER.info(
+            "%s unanswered by %s %d times in a row, skipping it for %d s",
+            code,
+            host,
+            misses,
+            UNSUPPORTED_BACKOFF,
+        )
+
+    @property
+    def unsupported_commands(self) -> list[str]:
+        """Return the reference codes currently skipped as unsupported."""
+        now = self.hass.loop.time()
+        return sorted(
+            code for code, until in self._unsupported_until.items() if until > now
+        )
+
+    async def _async_disconnect(self) -> None:
+        """Drop the projector session so the next poll reconnects."""
+        self._connected = False
+        with suppress(Exception):
+            async with asyncio.timeout(DISCONNECT_TIMEOUT):
+                await self.device.disconnect()
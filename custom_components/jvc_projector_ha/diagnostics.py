@@ -0,0 +1,21 @@
+"""Diagnostics support for JVC Projector."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import JVCConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: JVCConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+
+    return {
+        "data": coordinator.data,
+        "unsupported_commands": coordinator.unsupported_commands,
+    }
@@ -7,6 +7,7 @@ from .error import (
     JvcProjectorCommandError,
     JvcProjectorConnectError,
     JvcProjectorError,
+    JvcProjectorTimeoutError,
 )
 from .projector import JvcProjector
 
@@ -46,323 +46,370 @@ PMDC: Final = "PMDC"  # Dynamic Control (2024 spec)
 
 AUTH_SALT: Final = "JVCKWPJ"
 
+Formatter = tuple | dict | Callable
+
+
+# Formatter key: optional literal prefix, optional (?:A|B) code alternation and
+# the value group, either fixed width (".", "..") or any length (".+")
+_FORMATTER_KEY = re.compile(r"(\w*)(?:\(\?:([\w|]+)\))?\((\.+|\.\+)\)")
+
+
+def _index_formatters(
+    formatters: dict[str, Formatter],
+) -> dict[str, tuple[int | None, Formatter]]:
+    """Expand formatter keys into a lookup by exact command code.
+
+    Each entry holds the expected response width (None for any length) and the
+    formatter. The first key listing a code wins.
+    """
+    index: dict[str, tuple[int | None, Formatter]] = {}
+    for key, fmt in formatters.items():
+        m = _FORMATTER_KEY.fullmatch(key)
+        if m is None:
+            raise ValueError(f"Unsupported formatter key '{key}'")
+        prefix, alternatives, value = m.groups()
+        width = None if value == ".+" else len(value)
+        for code in alternatives.split("|") if alternatives else ("",):
+            index.setdefault(prefix + code, (width, fmt))
+    return index
+
 
 class JvcCommand:
     """Class for representing a JVC Projector command."""
 
+    __slots__ = ("_cached", "_cached_valid", "_response", "ack", "code", "is_ref")
+
     def __init__(self, code: str, is_ref=False):
         """Initialize class."""
         self.code = code
         self.is_ref = is_ref
         self.ack = False
         self._response: str | None = None
+        self._cached: str | None = None
+        self._cached_valid = False
 
     @property
     def response(self) -> str | None:
-        """Return command response."""
+        """Return command response, formatted once per received value."""
+        if not self._cached_valid:
+            self._cached = self._format()
+            self._cached_valid = True
+        return self._cached
+
+    @response.setter
+    def response(self, data: str) -> None:
+        """Set command response."""
+        self._response = data
+        self._cached_valid = False
+
+    def _format(self) -> str | None:
+        """Format the raw response for this command."""
         if not self.is_ref or self._response is None:
             return None
 
-        res = self.code + self._response
-        val: str = res[len(self.code) :]
+        val = self._response
+        entry = _FORMATTERS_BY_CODE.get(self.code)
+        if entry is None:
+            return val
 
-        for pat, fmt in self.formatters.items():
-            m = re.search(r"^" + pat + r"$", res)
-            if m:
-                if isinstance(fmt, list):
-                    try:
-                        return fmt[int(m[1], 16)]
-                    except ValueError:
-                        msg = "response '%s' not int for cmd '%s'"
-                        _LOGGER.warning(msg, val, self.code)
-                    except KeyError:
-                        msg = "response '%s' not mapped for cmd '%s'"
-                        _LOGGER.warning(msg, val, self.code)
-                elif isinstance(fmt, dict):
-                    try:
-                        return fmt[m[1]]
-                    except KeyError:
-                        msg = "response '%s' not mapped for cmd '%s'"
-                        _LOGGER.warning(msg, val, self.code)
-                elif callable(fmt):
-                    try:
-                        return fmt(m)
-                    except Exception as e:  # noqa: BLE001
-                        msg = "response format failed with %s for '%s (%s)'"
-                        _LOGGER.warning(msg, e, self.code, val)
-                break
+        # Responses of unexpected width are returned unformatted
+        width, fmt = entry
+        if not val or (width is not None and len(val) != width):
+            return val
 
-        return val
+        if isinstance(fmt, tuple):
+            try:
+                return fmt[int(val, 16)]
+            except ValueError:
+                msg = "response '%s' not int for cmd '%s'"
+                _LOGGER.warning(msg, val, self.code)
+            except IndexError:
+                msg = "response '%s' not mapped for cmd '%s'"
+                _LOGGER.warning(msg, val, self.code)
+        elif isinstance(fmt, dict):
+            try:
+                return fmt[val]
+            except KeyError:
+                msg = "response '%s' not mapped for cmd '%s'"
+                _LOGGER.warning(msg, val, self.code)
+        elif callable(fmt):
+            try:
+                return fmt(val)
+            except Exception as e:  # noqa: BLE001
+                msg = "response format failed with %s for '%s (%s)'"
+                _LOGGER.warning(msg, e, self.code, val)
 
-    @response.setter
-    def response(self, data: str) -> None:
-        """Set command response."""
-        self._response = data
+        return val
 
     @property
     def is_power(self) -> bool:
         """Return if command is a power command."""
         return self.code.startswith("PW")
 
-    formatters: dict[str, list | dict | Callable] = {
-        # Power
-        "PW(.)": [const.STANDBY, const.ON, const.COOLING, const.WARMING, const.ERROR],
-        # Input
-        "(?:IP|IFIN)(.)": {
-            "0": "svideo",
-            "1": "video",
-            "2": "component",
-            "3": "pc",
-            "6": const.HDMI1,
-            "7": const.HDMI2,
-        },
-        # Source
-        "SC(.)": [const.NOSIGNAL, const.SIGNAL],
-        # Source Display (IFIS) - Special 4 Data (2 bytes) - Table 3-60
-        "IFIS(..)": {
-            "02": "480p",
-            "03": "576p",
-            "04": "720p50",
-            "05": "720p60",
-            "08": "1080p24",
-            "09": "1080p50",
-            "0A": "1080p60",
-            "0B": "No Signal",
-            "0F": "Out of Range",
-            "10": "4k(4096)60",
-            "11": "4k(4096)50",
-            "12": "4k(4096)30",
-            "13": "4k(4096)25",
-            "14": "4k(4096)24",
-            "15": "4k(3840)60",
-            "16": "4k(3840)50",
-            "17": "4k(3840)30",
-            "18": "4k(3840)25",
-            "19": "4k(3840)24",
-            "1C": "1080p25",
-            "1D": "1080p30",
-            "1E": "2048x1080 p24",
-            "1F": "2048x1080 p25",
-            "20": "2048x1080 p30",
-            "21": "2048x1080 p50",
-            "22": "2048x1080 p60",
-            "25": "VGA(640x480)",
-            "26": "SVGA(800x600)",
-            "2C": "WUXGA(1920x1200)",
-            "30": "UXGA(1600x1200)",
-            "31": "QXGA",
-            "3D": "WQHD60",
-        },
-        # Light Source Time (IFLT) - Numeric data in hex, convert to decimal
-        "IFLT(....)": lambda r: str(int(r[1], 16)),
-        # LD Current Value (PMCV) - Numeric data in hex, convert to decimal
-        "PMCV(....)": lambda r: str(int(r[1], 16)),
-        # Colorimetry (IFCM) - Color space information from source
-        "IFCM(.)": [
-            "no_data",
-            "bt601",
-            "bt709",
-            "xvycc601",
-            "xvycc709",
-            "sycc601",
-            "adobe_ycc601",
-            "adobe_rgb",
-            "bt2020(constant_luminance)",
-            "bt2020(non-constant_luminance)",
-            "srgb",
-            "dci_p3_d65",
-            "dci_p3_theater",
-        ],
-        # Model
-        "MD(.+)": lambda r: r[1].strip(),
-        # Input Display (IFIN) - already handled by "(?:IP|IFIN)(.)" pattern above
-        # Picture Mode (PMPM) - Table 3-19 - Response is PM + 2 bytes (must come before PMCT!)
-        "PMPM(..)": {
-            "01": "cinema",
-            "03": "natural",
-            "0B": "frame_adapt_hdr",
-            "0C": "sdr1",
-            "0D": "sdr2",
-            "0E": "hdr1",
-            "0F": "hdr2",
-            "14": "hlg",
-            "15": "hdr10+",
-            "17": "filmmaker",
-            "18": "frame_adapt_hdr2",
-            "1B": "vivid",
-        },
-        # Content Type (PMCT) - Table 3-32 - Response is PM + 1 byte
-        "PMCT(.)": {
-            "0": "auto",
-            "1": "sdr",
-            "2": "hdr10+",
-            "3": "hdr10",
-            "4": "hlg",
-        },
-        # Auto transition value for Content Type (PMAT) - Table 3-33 - Response is PM + 1 byte
-        "PMAT(.)": {
-            "1": "sdr",
-            "2": "hdr10+",
-            "3": "hdr10",
-            "4": "hlg",
-        },
-        # Picture Mode - Intelligent Lens Aperture
-        "PMDI(.)": ["off", "auto1", "auto2"],
-        # Picture Mode - Color Profile
-        "PMPR(..)": {
-            "00": "off",
-            "01": "film1",
-            "02": "film2",
-            "03": "bt709",
-            "04": "cinema",
-            "05": "cinema2",
-            "06": "anime",
-            "07": "anime2",
-            "08": "video",
-            "09": "vivid",
-            "0A": "hdr",
-            "0B": "bt2020(wide)",
-            "0C": "3d",
-            "0D": "thx",
-            "0E": "custom1",
-            "0F": "custom2",
-            "10": "custom3",
-            "11": "custom4",
-            "12": "custom5",
-            "21": "dci",
-            "22": "custom6",
-            "24": "bt2020(normal)",
-            "25": "off(wide)",
-            "26": "auto",
-        },
-        # Picture Mode - Color Temp
-        "PMCL(..)": {
-            "00": "5500k",
-            "02": "6500k",
-            "04": "7500k",
-            "08": "9300k",
-            "09": "high",
-            "0A": "custom1",
-            "0B": "custom2",
-            "0C": "hdr10",
-            "0D": "xenon1",
-            "0E": "xenon2",
-            "14": "hlg",
-        },
-        # Picture Mode - Color Correction
-        "PMCC(..)": {
-            "00": "5500k",
-            "02": "6500k",
-            "04": "7500k",
-            "08": "9300k",
-            "09": "high",
-            "0D": "xenon1",
-            "0E": "xenon2",
-        },
-        # Picture Mode - Gamma Table
-        "PMGT(..)": {
-            "00": "2.2",
-            "01": "cinema1",
-            "02": "cinema2",
-            "04": "custom1",
-            "05": "custom2",
-            "06": "custom3",
-            "07": "hdr_hlg",
-            "08": "2.4",
-            "09": "2.6",
-            "0A": "film1",
-            "0B": "film2",
-            "0C": "hdr_pq",
-            "0D": "pana_pq",
-            "10": "thx",
-            "15": "hdr_auto",
-        },
-        # Picture Mode - Color Management, Low Latency, 8K E-Shift
-        "PM(?:CB|LL|US)(.)": ["off", "on"],
-        # Picture Mode - Clear Motion Drive
-        "PMCM(.)": ["off", None, None, "low", "high", "inverse_telecine"],
-        # Picture Mode - Motion Enhance
-        "PMME(.)": ["off", "low", "high"],
-        # Picture Mode - Dynamic Control (Table 3-25)
-        "PMDC(.)": ["off", "low", "high", "balanced"],
-        # Picture Mode - Graphics Mode
-        "PMGM(.)": ["standard", "high-res"],
-        # Input Signal - HDMI Input Level
-        "ISIL(.)": ["standard", "enhanced", "super_white", "auto"],
-        # Input Signal - HDMI Color Space
-        "ISHS(.)": ["auto", "ycbcr(4:4:4)", "ycbcr(4:2:2)", "rgb"],
-        # Input Signal - HDMI 2D/3D
-        "IS3D(.)": ["2d", "auto", None, "side_by_side", "top_bottom"],
-        # Input Signal - Aspect
-        "ISAS(.)": [None, None, "zoom", "auto", "native"],
-        # Input Signal - Mask
-        "ISMA(.)": [None, "on", "off"],
-        # Installation - Lens Control
-        "IN(?:FN|FF|ZT|ZW|SL|SR|SU|SD)(.)": ["stop", "start"],
-        # Installation - Lens Image Pattern, Lens Lock, Screen Adjust
-        "IN(?:IP|LL|SC|HA)(.)": ["off", "on"],
-        # Installation - Style
-        "INIS(.)": ["front", "front_ceiling", "rear", "rear_ceiling"],
-        # Installation - Anamorphic
-        "INVS(.)": ["off", "a", "b", "c", "d"],
-        # Display - Back Color
-        "DSBC(.)": ["blue", "black"],
-        # Display - Menu Positions
-        "DSMP(.)": [
-            "left-top",
-            "right-top",
-            "center",
-            "left-bottom",
-            "right-bottom",
-            "left",
-            "right",
-        ],
-        # Installation - Source Display, Logo Data
-        "DS(?:SD|LO)(.)": ["off", "on"],
-        # Function - Trigger
-        "FUTR(.)": [
-            "off",
-            "power",
-            "anamo",
-            "ins1",
-            "ins2",
-            "ins3",
-            "ins4",
-            "ins5",
-            "ins6",
-            "ins7",
-            "ins8",
-            "ins9",
-            "ins10",
-        ],
-        # Function - Off Timer
-        "FUOT(.)": ["off", "1hour", "2hour", "3hour", "4hour"],
-        # Function - Eco Mode, Control4
-        "FU(?:EM|CF)(.)": ["off", "on"],
-        # Function - Deep Color
-        "IFDC(.)": ["8bit", "10bit", "12bit"],
-        # Function - Color Space
-        "IFXV(.)": ["rgb", "yuv"],
-        # Function - HDR
-        "IFHR(.)": {
-            "0": "sdr",
-            "1": "hdr",
-            "2": "smpte_st_2084",
-            "3": "hybrid_log",
-            "F": "none",
-        },
-        # Picture Mode - HDR Level
-        "PMHL(.)": ["auto", "-2", "-1", "0", "1", "2"],
-        # Picture Mode - HDR Processing
-        "PMHP(.)": ["static", "frame", "scene"],
-        # Picture Mode - Theater Optimizer
-        "PMNM(.)": ["off", "on"],
-        # Picture Mode - Theater Optimizer Level
-        "PMNL(.)": ["reserved", "low", "medium", "high"],
-        # Picture Mode - Theater Optimizer Processing
-        "PMNP(.)": ["-", "start"],
-        # Lan Setup
-        "LSDS(.)": [const.OFF, const.ON],
-        "LSMA(.+)": lambda r: re.sub(r"-+", "-", r[1].replace(" ", "-")),
-        "LSIP(..)(..)(..)(..)": lambda r: f"{int(r[1], 16)}.{int(r[2], 16)}.{int(r[3], 16)}.{int(r[4], 16)}",
-    }
+
+_FORMATTERS: dict[str, Formatter] = {
+    # Power
+    "PW(.)": (const.STANDBY, const.ON, const.COOLING, const.WARMING, const.ERROR),
+    # Input
+    "(?:IP|IFIN)(.)": {
+        "0": "svideo",
+        "1": "video",
+        "2": "component",
+        "3": "pc",
+        "6": const.HDMI1,
+        "7": const.HDMI2,
+    },
+    # Source
+    "SC(.)": (const.NOSIGNAL, const.SIGNAL),
+    # Source Display (IFIS) - Special 4 Data (2 bytes) - Table 3-60
+    "IFIS(..)": {
+        "02": "480p",
+        "03": "576p",
+        "04": "720p50",
+        "05": "720p60",
+        "08": "1080p24",
+        "09": "1080p50",
+        "0A": "1080p60",
+        "0B": "No Signal",
+        "0F": "Out of Range",
+        "10": "4k(4096)60",
+        "11": "4k(4096)50",
+        "12": "4k(4096)30",
+        "13": "4k(4096)25",
+        "14": "4k(4096)24",
+        "15": "4k(3840)60",
+        "16": "4k(3840)50",
+        "17": "4k(3840)30",
+        "18": "4k(3840)25",
+        "19": "4k(3840)24",
+        "1C": "1080p25",
+        "1D": "1080p30",
+        "1E": "2048x1080 p24",
+        "1F": "2048x1080 p25",
+        "20": "2048x1080 p30",
+        "21": "2048x1080 p50",
+        "22": "2048x1080 p60",
+        "25": "VGA(640x480)",
+        "26": "SVGA(800x600)",
+        "2C": "WUXGA(1920x1200)",
+        "30": "UXGA(1600x1200)",
+        "31": "QXGA",
+        "3D": "WQHD60",
+    },
+    # Light Source Time (IFLT) - Numeric data in hex, convert to decimal
+    "IFLT(....)": lambda v: str(int(v, 16)),
+    # LD Current Value (PMCV) - Numeric data in hex, convert to decimal
+    "PMCV(....)": lambda v: str(int(v, 16)),
+    # Colorimetry (IFCM) - Color space information from source
+    "IFCM(.)": (
+        "no_data",
+        "bt601",
+        "bt709",
+        "xvycc601",
+        "xvycc709",
+        "sycc601",
+        "adobe_ycc601",
+        "adobe_rgb",
+        "bt2020(constant_luminance)",
+        "bt2020(non-constant_luminance)",
+        "srgb",
+        "dci_p3_d65",
+        "dci_p3_theater",
+    ),
+    # Model
+    "MD(.+)": lambda v: v.strip(),
+    # Input Display (IFIN) - already handled by "(?:IP|IFIN)(.)" pattern above
+    # Picture Mode (PMPM) - Table 3-19 - Response is PM + 2 bytes (must come before PMCT!)
+    "PMPM(..)": {
+        "01": "cinema",
+        "03": "natural",
+        "0B": "frame_adapt_hdr",
+        "0C": "sdr1",
+        "0D": "sdr2",
+        "0E": "hdr1",
+        "0F": "hdr2",
+        "14": "hlg",
+        "15": "hdr10+",
+        "17": "filmmaker",
+        "18": "frame_adapt_hdr2",
+        "1B": "vivid",
+    },
+    # Content Type (PMCT) - Table 3-32 - Response is PM + 1 byte
+    "PMCT(.)": {
+        "0": "auto",
+        "1": "sdr",
+        "2": "hdr10+",
+        "3": "hdr10",
+        "4": "hlg",
+    },
+    # Auto transition value for Content Type (PMAT) - Table 3-33 - Response is PM + 1 byte
+    "PMAT(.)": {
+        "1": "sdr",
+        "2": "hdr10+",
+        "3": "hdr10",
+        "4": "hlg",
+    },
+    # Picture Mode - Intelligent Lens Aperture
+    "PMDI(.)": ("off", "auto1", "auto2"),
+    # Picture Mode - Color Profile
+    "PMPR(..)": {
+        "00": "off",
+        "01": "film1",
+        "02": "film2",
+        "03": "bt709",
+        "04": "cinema",
+        "05": "cinema2",
+        "06": "anime",
+        "07": "anime2",
+        "08": "video",
+        "09": "vivid",
+        "0A": "hdr",
+        "0B": "bt2020(wide)",
+        "0C": "3d",
+        "0D": "thx",
+        "0E": "custom1",
+        "0F": "custom2",
+        "10": "custom3",
+        "11": "custom4",
+        "12": "custom5",
+        "21": "dci",
+        "22": "custom6",
+        "24": "bt2020(normal)",
+        "25": "off(wide)",
+        "26": "auto",
+    },
+    # Picture Mode - Color Temp
+    "PMCL(..)": {
+        "00": "5500k",
+        "02": "6500k",
+        "04": "7500k",
+        "08": "9300k",
+        "09": "high",
+        "0A": "custom1",
+        "0B": "custom2",
+        "0C": "hdr10",
+        "0D": "xenon1",
+        "0E": "xenon2",
+        "14": "hlg",
+    },
+    # Picture Mode - Color Correction
+    "PMCC(..)": {
+        "00": "5500k",
+        "02": "6500k",
+        "04": "7500k",
+        "08": "9300k",
+        "09": "high",
+        "0D": "xenon1",
+        "0E": "xenon2",
+    },
+    # Picture Mode - Gamma Table
+    "PMGT(..)": {
+        "00": "2.2",
+        "01": "cinema1",
+        "02": "cinema2",
+        "04": "custom1",
+        "05": "custom2",
+        "06": "custom3",
+        "07": "hdr_hlg",
+        "08": "2.4",
+        "09": "2.6",
+        "0A": "film1",
+        "0B": "film2",
+        "0C": "hdr_pq",
+        "0D": "pana_pq",
+        "10": "thx",
+        "15": "hdr_auto",
+    },
+    # Picture Mode - Color Management, Low Latency, 8K E-Shift
+    "PM(?:CB|LL|US)(.)": ("off", "on"),
+    # Picture Mode - Clear Motion Drive
+    "PMCM(.)": ("off", None, None, "low", "high", "inverse_telecine"),
+    # Picture Mode - Motion Enhance
+    "PMME(.)": ("off", "low", "high"),
+    # Picture Mode - Dynamic Control (Table 3-25)
+    "PMDC(.)": ("off", "low", "high", "balanced"),
+    # Picture Mode - Graphics Mode
+    "PMGM(.)": ("standard", "high-res"),
+    # Input Signal - HDMI Input Level
+    "ISIL(.)": ("standard", "enhanced", "super_white", "auto"),
+    # Input Signal - HDMI Color Space
+    "ISHS(.)": ("auto", "ycbcr(4:4:4)", "ycbcr(4:2:2)", "rgb"),
+    # Input Signal - HDMI 2D/3D
+    "IS3D(.)": ("2d", "auto", None, "side_by_side", "top_bottom"),
+    # Input Signal - Aspect
+    "ISAS(.)": (None, None, "zoom", "auto", "native"),
+    # Input Signal - Mask
+    "ISMA(.)": (None, "on", "off"),
+    # Installation - Lens Control
+    "IN(?:FN|FF|ZT|ZW|SL|SR|SU|SD)(.)": ("stop", "start"),
+    # Installation - Lens Image Pattern, Lens Lock, Screen Adjust
+    "IN(?:IP|LL|SC|HA)(.)": ("off", "on"),
+    # Installation - Style
+    "INIS(.)": ("front", "front_ceiling", "rear", "rear_ceiling"),
+    # Installation - Anamorphic
+    "INVS(.)": ("off", "a", "b", "c", "d"),
+    # Display - Back Color
+    "DSBC(.)": ("blue", "black"),
+    # Display - Menu Positions
+    "DSMP(.)": (
+        "left-top",
+        "right-top",
+        "center",
+        "left-bottom",
+        "right-bottom",
+        "left",
+        "right",
+    ),
+    # Installation - Source Display, Logo Data
+    "DS(?:SD|LO)(.)": ("off", "on"),
+    # Function - Trigger
+    "FUTR(.)": (
+        "off",
+        "power",
+        "anamo",
+        "ins1",
+        "ins2",
+        "ins3",
+        "ins4",
+        "ins5",
+        "ins6",
+        "ins7",
+        "ins8",
+        "ins9",
+        "ins10",
+    ),
+    # Function - Off Timer
+    "FUOT(.)": ("off", "1hour", "2hour", "3hour", "4hour"),
+    # Function - Eco Mode, Control4
+    "FU(?:EM|CF)(.)": ("off", "on"),
+    # Function - Deep Color
+    "IFDC(.)": ("8bit", "10bit", "12bit"),
+    # Function - Color Space
+    "IFXV(.)": ("rgb", "yuv"),
+    # Function - HDR
+    "IFHR(.)": {
+        "0": "sdr",
+        "1": "hdr",
+        "2": "smpte_st_2084",
+        "3": "hybrid_log",
+        "F": "none",
+    },
+    # Picture Mode - HDR Level
+    "PMHL(.)": ("auto", "-2", "-1", "0", "1", "2"),
+    # Picture Mode - HDR Processing
+    "PMHP(.)": ("static", "frame", "scene"),
+    # Picture Mode - Theater Optimizer
+    "PMNM(.)": ("off", "on"),
+    # Picture Mode - Theater Optimizer Level
+    "PMNL(.)": ("reserved", "low", "medium", "high"),
+    # Picture Mode - Theater Optimizer Processing
+    "PMNP(.)": ("-", "start"),
+    # Lan Setup
+    "LSDS(.)": (const.OFF, const.ON),
+    "LSMA(.+)": lambda v: re.sub(r"-+", "-", v.replace(" ", "-")),
+    "LSIP(........)": lambda v: ".".join(
+        str(int(v[i : i + 2], 16)) for i in range(0, 8, 2)
+    ),
+}
+
+_FORMATTERS_BY_CODE = _index_formatters(_FORMATTERS)
@@ -33,23 +33,36 @@ class JvcConnection:
 
     def is_connected(self) -> bool:
         """Return if connected to device."""
-        return self._reader is not None and self._writer is not None
+        return (
+            self._reader is not None
+            and self._writer is not None
+            and not self._reader.at_eof()
+            and not self._writer.is_closing()
+        )
 
     async def connect(self) -> None:
         """Connect to device."""
-        assert self._reader is None and self._writer is None
-        conn = asyncio.open_connection(self._ip, self._port)
-        self._reader, self._writer = await asyncio.wait_for(conn, timeout=self._timeout)
+        if self._writer is not None:
+            # Drop a stale session the projector closed on its side
+            await self.disconnect()
+        # asyncio stream transports already enable TCP_NODELAY, and _ip is the
+        # address resolved once by JvcProjector, so no per-connect DNS lookup
+        async with asyncio.timeout(self._timeout):
+            self._reader, self._writer = await asyncio.open_connection(
+                self._ip, self._port
+            )
 
     async def read(self, n: int) -> bytes:
         """Read n bytes from device."""
         assert self._reader
-        return await asyncio.wait_for(self._reader.read(n), timeout=self._timeout)
+        async with asyncio.timeout(self._timeout):
+            return await self._reader.read(n)
 
     async def readline(self) -> bytes:
         """Read all bytes up to newline from device."""
         assert self._reader
-        return await asyncio.wait_for(self._reader.readline(), timeout=self._timeout)
+        async with asyncio.timeout(self._timeout):
+            return await self._reader.readline()
 
     async def write(self, data: bytes) -> None:
         """Write data to device."""
@@ -1,5 +1,6 @@
 """Device constants for a JVC Projector."""
 
+from types import MappingProxyType
 from typing import Final
 
 POWER: Final = "power"
@@ -69,38 +70,43 @@ REMOTE_NATURAL: Final = "736A"
 REMOTE_CINEMA: Final = "7368"
 
 # Mapping of user-friendly button names to remote codes
-REMOTE_BUTTON_MAP: Final = {
-    "standby": REMOTE_STANDBY,
-    "on": REMOTE_ON,
-    "menu": REMOTE_MENU,
-    "up": REMOTE_UP,
-    "down": REMOTE_DOWN,
-    "left": REMOTE_LEFT,
-    "right": REMOTE_RIGHT,
-    "ok": REMOTE_OK,
-    "back": REMOTE_BACK,
-    "mpc": REMOTE_MPC,
-    "hide": REMOTE_HIDE,
-    "info": REMOTE_INFO,
-    "input": REMOTE_INPUT,
-    "advanced_menu": REMOTE_ADVANCED_MENU,
-    "picture_mode": REMOTE_PICTURE_MODE,
-    "color_profile": REMOTE_COLOR_PROFILE,
-    "lens_control": REMOTE_LENS_CONTROL,
-    "setting_memory": REMOTE_SETTING_MEMORY,
-    "gamma_settings": REMOTE_GAMMA_SETTINGS,
-    "cmd": REMOTE_CMD,
-    "mode_1": REMOTE_MODE_1,
-    "mode_2": REMOTE_MODE_2,
-    "mode_3": REMOTE_MODE_3,
-    "hdmi_1": REMOTE_HDMI_1,
-    "hdmi_2": REMOTE_HDMI_2,
-    "lens_ap": REMOTE_LENS_AP,
-    "anamo": REMOTE_ANAMO,
-    "gamma": REMOTE_GAMMA,
-    "color_temp": REMOTE_COLOR_TEMP,
-    "3d_format": REMOTE_3D_FORMAT,
-    "pic_adj": REMOTE_PIC_ADJ,
-    "natural": REMOTE_NATURAL,
-    "cinema": REMOTE_CINEMA,
-}
+REMOTE_BUTTON_MAP: Final = MappingProxyType(
+    {
+        "standby": REMOTE_STANDBY,
+        "on": REMOTE_ON,
+        "menu": REMOTE_MENU,
+        "up": REMOTE_UP,
+        "down": REMOTE_DOWN,
+        "left": REMOTE_LEFT,
+        "right": REMOTE_RIGHT,
+        "ok": REMOTE_OK,
+        "back": REMOTE_BACK,
+        "mpc": REMOTE_MPC,
+        "hide": REMOTE_HIDE,
+        "info": REMOTE_INFO,
+        "input": REMOTE_INPUT,
+        "advanced_menu": REMOTE_ADVANCED_MENU,
+        "picture_mode": REMOTE_PICTURE_MODE,
+        "color_profile": REMOTE_COLOR_PROFILE,
+        "lens_control": REMOTE_LENS_CONTROL,
+        "setting_memory": REMOTE_SETTING_MEMORY,
+        "gamma_settings": REMOTE_GAMMA_SETTINGS,
+        "cmd": REMOTE_CMD,
+        "mode_1": REMOTE_MODE_1,
+        "mode_2": REMOTE_MODE_2,
+        "mode_3": REMOTE_MODE_3,
+        "hdmi_1": REMOTE_HDMI_1,
+        "hdmi_2": REMOTE_HDMI_2,
+        "lens_ap": REMOTE_LENS_AP,
+        "anamo": REMOTE_ANAMO,
+        "gamma": REMOTE_GAMMA,
+        "color_temp": REMOTE_COLOR_TEMP,
+        "3d_format": REMOTE_3D_FORMAT,
+        "pic_adj": REMOTE_PIC_ADJ,
+        "natural": REMOTE_NATURAL,
+        "cinema": REMOTE_CINEMA,
+    }
+)
+
+# Button names in map order, offered as the remote entity activities
+REMOTE_ACTIVITY_LIST: Final = tuple(REMOTE_BUTTON_MAP)
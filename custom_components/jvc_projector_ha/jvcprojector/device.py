@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 from hashlib import sha256
 import logging
 import re
@@ -29,6 +30,7 @@ from .error import (
     JvcProjectorAuthError,
     JvcProjectorCommandError,
     JvcProjectorConnectError,
+    JvcProjectorTimeoutError,
 )
 
 KEEPALIVE_TTL = 2
@@ -46,11 +48,17 @@ class JvcDevice:
     """Class for representing a JVC Projector device."""
 
     def __init__(
-        self, ip: str, port: int, timeout: float, password: str | None = None
+        self,
+        ip: str,
+        port: int,
+        timeout: float,
+        password: str | None = None,
+        persistent: bool = False,
     ) -> None:
         """Initialize class."""
         self._conn = JvcConnection(ip, port, timeout)
         self._timeout = timeout
+        self._persistent = persistent
 
         self._password = password or ""
         self._auth = b""
@@ -86,31 +94,54 @@ class JvcDevice:
 
             # Connection keepalive window for fast command repeats
             if self._keepalive:
-                self._keepalive.cancel()
-                self._keepalive = None
+                await self._cancel_keepalive()
             elif is_refresh:
                 # Don't extend window below if this was a refresh
                 keepalive = False
 
+            failed = False
+
             try:
-                if not self._conn.is_connected():
+                # A reused session may have been closed by the projector since
+                reused = self._conn.is_connected()
+                if not reused:
                     await self._connect()
 
                 cmd = None
-
-                for cmd in cmds:
-                    await self._send(cmd)
+                index = 0
+
+                while index < len(cmds):
+                    cmd = cmds[index]
+                    try:
+                        await self._send(cmd)
+                    except (BrokenPipeError, ConnectionResetError):
+                        if not reused:
+                            raise
+                        # Reconnect once and resend from the unacknowledged command
+                        reused = False
+                        _LOGGER.debug(
+                            "Session closed by %s, reconnecting", self._conn.ip
+                        )
+                        await self._conn.disconnect()
+                        await self._connect()
+                        continue
                     # Throttle since some projectors dont like back to back commands
                     await asyncio.sleep(COMMAND_THROTTLE_DELAY)
                     # If device is not powered on, skip remaining commands
                     if is_refresh and cmds[0].response != const.ON:
                         break
-            except Exception:
+                    index += 1
+            except BaseException:
                 keepalive = False
+                failed = True
                 raise
             finally:
+                if self._persistent:
+                    # Persistent sessions stay open and are only dropped on error
+                    if failed:
+                        await self._disconnect()
                 # Delay disconnect to keep connection alive.
-                if keepalive and cmd and cmd.ack:
+                elif keepalive and cmd and cmd.ack:
                     self._keepalive = asyncio.create_task(
                         self._disconnect(KEEPALIVE_TTL)
                     )
@@ -217,21 +248,26 @@ class JvcDevice:
         )
         await self._conn.write(data)
 
-        # Log what ACK we're expecting
+        # Log what ACK we're expecting (also used to validate it below). The
+        # projector only echoes the two-character command header, so e.g. IFLT
+        # and IFIS answers look alike; the timeouts below keep them in step.
         expected_ack = HEAD_ACK + code[0:2]
         _LOGGER.debug("Expecting ACK starting with: %s", expected_ack)
 
         try:
             data = await self._conn.readline()
-        except asyncio.TimeoutError:
-            _LOGGER.warning(
-                "Response timeout for '%s' - no ACK received after 30s", cmd.code
-            )
+        except asyncio.TimeoutError as err:
+            self._response_timeout(cmd, "ACK", err)
             return
 
         _LOGGER.debug("Received ack %s", data)
 
-        if not data.startswith(HEAD_ACK + code[0:2]):
+        if not data:
+            raise ConnectionResetError(
+                f"Connection closed awaiting ack for '{cmd.code}'"
+            )
+
+        if not data.startswith(expected_ack):
             raise JvcProjectorCommandError(
                 f"Response ack invalid '{data!r}' for '{cmd.code}'"
             )
@@ -239,11 +275,18 @@ class JvcDevice:
         if cmd.is_ref:
             try:
                 data = await self._conn.readline()
-            except asyncio.TimeoutError:
-                _LOGGER.warning("Ref response timeout for '%s'", cmd.code)
+            except asyncio.TimeoutError as err:
+                self._response_timeout(cmd, "response", err)
                 return
 
-            _LOGGER.debug("Received ref %s (%s)", data[HEAD_LEN + 2 : -1], data)
+            if not data:
+                raise ConnectionResetError(
+                    f"Connection closed awaiting response for '{cmd.code}'"
+                )
+
+            # Sliced once for both the debug log and the response
+            value = data[HEAD_LEN + 2 : -1]
+            _LOGGER.debug("Received ref %s (%s)", value, data)
 
             if not data.startswith(HEAD_RES + code[0:2]):
                 raise JvcProjectorCommandError(
@@ -251,13 +294,27 @@ class JvcDevice:
                 )
 
             try:
-                cmd.response = data[HEAD_LEN + 2 : -1].decode()
+                cmd.response = value.decode()
             except UnicodeDecodeError:
                 cmd.response = data.hex()
                 _LOGGER.warning("Failed to decode response '%s'", data)
 
         cmd.ack = True
 
+    def _response_timeout(
+        self, cmd: JvcCommand, expected: str, err: asyncio.TimeoutError
+    ) -> None:
+        """Handle a command left unanswered within the timeout.
+
+        A late reply would be read as the answer to the next command, so a
+        persistent session is failed (and dropped by send()) rather than reused.
+        """
+        if self._persistent:
+            raise JvcProjectorTimeoutError(
+                f"No {expected} received for '{cmd.code}'"
+            ) from err
+        _LOGGER.warning("No %s received for '%s'", expected, cmd.code)
+
     async def remote(self, code: str, timeout: float | None = None) -> None:
         """Send a remote control code.
 
@@ -272,9 +329,18 @@ class JvcDevice:
     async def disconnect(self) -> None:
         """Disconnect from device."""
         if self._keepalive:
-            self._keepalive.cancel()
+            await self._cancel_keepalive()
         await self._disconnect()
 
+    async def _cancel_keepalive(self) -> None:
+        """Cancel the delayed disconnect and wait for it to finish."""
+        task, self._keepalive = self._keepalive, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
     async def _disconnect(self, delay: int = 0) -> None:
         """Disconnect from device."""
         if delay:
@@ -9,6 +9,10 @@ class JvcProjectorConnectError(JvcProjectorError):
     """Projector Connect Timeout."""
 
 
+class JvcProjectorTimeoutError(JvcProjectorConnectError):
+    """Projector Response Timeout on a persistent session."""
+
+
 class JvcProjectorCommandError(JvcProjectorError):
     """Projector Command Error."""
 
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from . import command, const
 from .command import JvcCommand
 from .connection import resolve
 from .device import JvcDevice
-from .error import JvcProjectorConnectError, JvcProjectorError
+from .error import (
+    JvcProjectorConnectError,
+    JvcProjectorError,
+    JvcProjectorTimeoutError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PORT = 20554
 DEFAULT_TIMEOUT = 15.0
 
+# Model reported when the device did not answer the model reference
+UNKNOWN_MODEL = "(unknown)"
+
 
 class JvcProjector:
     """Class for interacting with a JVC Projector."""
@@ -26,12 +34,14 @@ class JvcProjector:
         port: int = DEFAULT_PORT,
         timeout: float = DEFAULT_TIMEOUT,
         password: str | None = None,
+        persistent: bool = False,
     ) -> None:
         """Initialize class."""
         self._host = host
         self._port = port
         self._timeout = timeout
         self._password = password
+        self._persistent = persistent
 
         self._device: JvcDevice | None = None
         self._ip: str = ""
@@ -85,7 +95,7 @@ class JvcProjector:
         # Create device only once - reuse across connections
         if self._device is None:
             self._device = JvcDevice(
-                self._ip, self._port, self._timeout, self._password
+                self._ip, self._port, self._timeout, self._password, self._persistent
             )
 
         if not await self.test():
@@ -114,25 +124,27 @@ class JvcProjector:
             raise JvcProjectorError("Mac address not available")
 
         if model.response is None:
-            model.response = "(unknown)"
+            model.response = UNKNOWN_MODEL
 
         self._model = model.response
         self._mac = mac.response
 
         return {"model": self._model, "mac": self._mac}
 
-    async def get_state(self) -> dict[str, str | None]:
-        """Get device state."""
+    async def get_state(self) -> dict[str, str]:
+        """Get device state, omitting power if the device did not report it."""
         assert self._device
         pwr = JvcCommand(command.POWER, True)
         inp = JvcCommand(command.INPUT, True)
         src = JvcCommand(command.SOURCE, True)
         res = await self._send([pwr, inp, src])
-        return {
-            "power": res[0] or None,
+        state = {
             "input": res[1] or const.NOSIGNAL,
             "source": res[2] or const.NOSIGNAL,
         }
+        if res[0]:
+            state["power"] = res[0]
+        return state
 
     async def get_version(self) -> str | None:
         """Get device software version."""
@@ -176,6 +188,38 @@ class JvcProjector:
         """Send reference code."""
         return (await self._send([JvcCommand(code, True)]))[0]
 
+    async def pipeline(
+        self, codes: list[str], unanswered: list[str] | None = None
+    ) -> list[str | None]:
+        """Send several reference codes in a single device exchange.
+
+        A reference left unanswered yields None and the rest are still sent,
+        on a fresh session if the device dropped the old one. Unanswered codes
+        are also appended to unanswered, including the one still awaited if
+        the caller's timeout cancels the exchange.
+        """
+        cmds = [JvcCommand(code, True) for code in codes]
+        pending = cmds
+        try:
+            while pending:
+                try:
+                    await self._send(pending)
+                    break
+                except JvcProjectorTimeoutError as err:
+                    # Commands before the unanswered one were acknowledged
+                    index = next(i for i, cmd in enumerate(pending) if not cmd.ack)
+                    code = pending[index].code
+                    _LOGGER.debug("Skipping unanswered %s: %s", code, err)
+                    if unanswered is not None:
+                        unanswered.append(code)
+                    pending = pending[index + 1 :]
+        except asyncio.CancelledError:
+            awaited = next((cmd for cmd in pending if not cmd.ack), None)
+            if unanswered is not None and awaited is not None:
+                unanswered.append(awaited.code)
+            raise
+        return [cmd.response for cmd in cmds]
+
     # async def _send(self, cmds: list[JvcCommand]) -> list[str | None]:
     #     """Send command to device."""
     #     if self._device is None:
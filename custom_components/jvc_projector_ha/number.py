@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import logging
 
 from .jvcprojector import command, const
+from .jvcprojector.projector import JvcProjectorTimeoutError
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -26,6 +27,11 @@ _LOGGER = logging.getLogger(__name__)
 LD_CURRENT_MIN = 109  # Minimum LD current value
 LD_CURRENT_MAX = 219  # Maximum LD current value
 
+# Scale factors between the protocol span (109-219) and the HA span (1-100)
+_LD_SPAN = LD_CURRENT_MAX - LD_CURRENT_MIN
+_PROTO_TO_HA = 99 / _LD_SPAN
+_HA_TO_PROTO = _LD_SPAN / 99
+
 
 @dataclass(frozen=True, kw_only=True)
 class JVCNumberEntityDescription(NumberEntityDescription):
@@ -57,7 +63,7 @@ async def async_setup_entry(
     """Set up JVC Projector number entities from a config entry."""
     coordinator = entry.runtime_data
     async_add_entities(
-        JvcNumber(coordinator, description) for description in JVC_NUMBERS
+        [JvcNumber(coordinator, description) for description in JVC_NUMBERS]
     )
 
 
@@ -81,7 +87,7 @@ class JvcNumber(JvcProjectorEntity, NumberEntity):
 
         LD Power control is only available when projector is on.
         """
-        if not self.coordinator.last_update_success:
+        if not super().available:
             return False
 
         power = self.coordinator.data.get(const.POWER)
@@ -106,11 +112,9 @@ class JvcNumber(JvcProjectorEntity, NumberEntity):
             protocol_value = float(raw_value)
             # Clamp to valid protocol range
             protocol_value = max(LD_CURRENT_MIN, min(LD_CURRENT_MAX, protocol_value))
-            # Map protocol range (109-219) to HA range (1-100)
-            ha_value = (
-                (protocol_value - LD_CURRENT_MIN) / (LD_CURRENT_MAX - LD_CURRENT_MIN)
-            ) * 99 + 1
-            return round(ha_value)
+            # Map protocol range (109-219) to HA range (1-100); the value is
+            # positive, so adding 0.5 and truncating rounds to nearest
+            return int((protocol_value - LD_CURRENT_MIN) * _PROTO_TO_HA + 1.5)
         except (ValueError, TypeError):
             _LOGGER.warning(
                 "Invalid %s value: %s",
@@ -125,38 +129,28 @@ class JvcNumber(JvcProjectorEntity, NumberEntity):
         ha_value = max(1, min(100, value))
 
         # Map HA range (1-100) to protocol range (109-219)
-        protocol_value = LD_CURRENT_MIN + ((ha_value - 1) / 99) * (
-            LD_CURRENT_MAX - LD_CURRENT_MIN
-        )
-        protocol_value = int(round(protocol_value))
+        protocol_value = int(LD_CURRENT_MIN + (ha_value - 1) * _HA_TO_PROTO + 0.5)
 
         # Convert to hex string (signed 2-byte hexadecimal, 4 characters)
         hex_value = f"{protocol_value:04X}"
 
-        _LOGGER.debug(
-            "Setting %s to HA value %d (protocol value %d, hex: %s)",
-            self.entity_description.key,
-            int(ha_value),
-            protocol_value,
-            hex_value,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Setting %s to HA value %d (protocol value %d, hex: %s)",
+                self.entity_description.key,
+                int(ha_value),
+                protocol_value,
+                hex_value,
+            )
 
         try:
             # Send command to projector (op takes a single concatenated string)
-            await asyncio.wait_for(
-                self.coordinator.device.op(
-                    f"{self.entity_description.command_code}{hex_value}",
-                ),
-                timeout=5.0,
-            )
-
-            # Update coordinator data immediately for responsiveness (store protocol value)
-            self.coordinator.data[self.entity_description.key] = protocol_value
-
-            # Request coordinator refresh to sync with actual device state
-            await self.coordinator.async_request_refresh()
-
-        except asyncio.TimeoutError:
+            async with self.coordinator.command_lock:
+                async with asyncio.timeout(5.0):
+                    await self.coordinator.device.op(
+                        f"{self.entity_description.command_code}{hex_value}",
+                    )
+        except (TimeoutError, JvcProjectorTimeoutError):
             _LOGGER.error(
                 "Timeout setting %s to %d",
                 self.entity_description.key,
@@ -169,3 +163,9 @@ class JvcNumber(JvcProjectorEntity, NumberEntity):
                 protocol_value,
                 err,
             )
+        else:
+            # Show the new value immediately (store protocol value); the boosted
+            # poll syncs with the actual device state
+            self.coordinator.async_set_optimistic(
+                self.entity_description.key, protocol_value
+            )
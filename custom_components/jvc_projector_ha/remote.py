@@ -3,18 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
 import logging
 from typing import Any, Iterable
 
 from .jvcprojector import const
-from .jvcprojector.const import REMOTE_BUTTON_MAP
-from .jvcprojector.projector import JvcProjectorConnectError
+from .jvcprojector.const import REMOTE_ACTIVITY_LIST, REMOTE_BUTTON_MAP
+from .jvcprojector.projector import JvcProjectorConnectError, JvcProjectorTimeoutError
 
 from homeassistant.components.remote import RemoteEntity, RemoteEntityFeature
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import JVCConfigEntry
+from .const import HEX_DIGITS, RESOLVED_REMOTE_CODES
 from .entity import JvcProjectorEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +23,11 @@ _LOGGER = logging.getLogger(__name__)
 COMMAND_GUARD = 0.15  # remote key presses
 POWER_COMMAND_GUARD = 0.75  # only if user double-taps power
 
+_POWER_ON_STATES = frozenset({const.ON, const.WARMING})
+
+# HA expects a list; build it once rather than on every state write
+_ACTIVITY_LIST = list(REMOTE_ACTIVITY_LIST)
+
 
 async def async_setup_entry(
     hass,
@@ -42,16 +47,14 @@ class JvcProjectorRemote(JvcProjectorEntity, RemoteEntity):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._last_command_time: datetime | None = None
+        # Event loop (monotonic) time of the last command; 0.0 means none yet
+        self._last_command_time = 0.0
         self._current_activity: str | None = None
 
     @property
     def is_on(self) -> bool:
         """Return True if projector is on or warming."""
-        return self.coordinator.data.get(const.POWER) in (
-            const.ON,
-            const.WARMING,
-        )
+        return self.coordinator.data.get(const.POWER) in _POWER_ON_STATES
 
     @property
     def current_activity(self) -> str | None:
@@ -61,21 +64,21 @@ class JvcProjectorRemote(JvcProjectorEntity, RemoteEntity):
     @property
     def activity_list(self) -> list[str]:
         """Return list of available remote buttons."""
-        return list(REMOTE_BUTTON_MAP.keys())
+        return _ACTIVITY_LIST
 
     async def _guard_if_needed(self, min_delay: float) -> None:
         """
         Apply delay ONLY if the previous command was very recent.
         First command is always instant.
         """
-        now = datetime.now()
+        loop = asyncio.get_running_loop()
 
-        if self._last_command_time is not None:
-            elapsed = (now - self._last_command_time).total_seconds()
+        if self._last_command_time:
+            elapsed = loop.time() - self._last_command_time
             if elapsed < min_delay:
                 await asyncio.sleep(min_delay - elapsed)
 
-        self._last_command_time = datetime.now()
+        self._last_command_time = loop.time()
 
     async def async_turn_on(self, activity: str | None = None, **kwargs: Any) -> None:
         """Turn the projector on or send a remote command via activity."""
@@ -95,16 +98,15 @@ class JvcProjectorRemote(JvcProjectorEntity, RemoteEntity):
 
             try:
                 await self.device.power_on()
-
-                # Give the projector a moment to transition to WARMING
-                await asyncio.sleep(0.3)
-
+            except JvcProjectorTimeoutError as err:
+                # Sent but left unacknowledged; the boosted poll shows the outcome
+                _LOGGER.warning("Power ON not acknowledged: %s", err)
             except JvcProjectorConnectError as err:
                 _LOGGER.error("Power ON failed: %s", err)
                 raise
 
-        # Force HA to re-read PW immediately (outside the lock)
-        await self.coordinator.async_refresh()
+        # Show WARMING right away; the boosted poll confirms it
+        self.coordinator.async_set_optimistic(const.POWER, const.WARMING)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the projector off"""
@@ -116,16 +118,15 @@ class JvcProjectorRemote(JvcProjectorEntity, RemoteEntity):
 
             try:
                 await self.device.power_off()
-
-                # Give the projector a moment to transition to COOLING
-                await asyncio.sleep(0.3)
-
+            except JvcProjectorTimeoutError as err:
+                # Sent but left unacknowledged; the boosted poll shows the outcome
+                _LOGGER.warning("Power OFF not acknowledged: %s", err)
             except JvcProjectorConnectError as err:
                 _LOGGER.error("Power OFF failed: %s", err)
                 raise
 
-        # Force HA to re-read PW immediately (outside the lock)
-        await self.coordinator.async_refresh()
+        # Show COOLING right away; the boosted poll confirms it
+        self.coordinator.async_set_optimistic(const.POWER, const.COOLING)
 
     async def async_send_command(
         self,
@@ -147,50 +148,57 @@ class JvcProjectorRemote(JvcProjectorEntity, RemoteEntity):
         mode_2, mode_3, hdmi_1, hdmi_2, lens_ap, anamo, gamma,
         color_temp, 3d_format, pic_adj, natural, cinema
         """
-        # Use coordinator's lock to prevent conflicts with polling
-        async with self.coordinator.command_lock:
-            for cmd in command:
-                # Normalize command to lowercase for lookup
-                cmd_lower = cmd.lower()
-
-                # Try user-friendly button name first
-                if cmd_lower in REMOTE_BUTTON_MAP:
-                    key_code = REMOTE_BUTTON_MAP[cmd_lower]
-                    key_name = cmd_lower
-                # Try REMOTE_* constant name (strip prefix if present)
-                elif cmd_lower.startswith("remote_"):
-                    button_name = cmd_lower[7:]  # Remove "remote_" prefix
-                    if button_name in REMOTE_BUTTON_MAP:
-                        key_code = REMOTE_BUTTON_MAP[button_name]
-                        key_name = button_name
-                    else:
-                        raise ValueError(f"Unknown remote button: {cmd}")
-                # Try as REMOTE_* constant (uppercase)
-                elif hasattr(const, cmd.upper()):
-                    key_code = getattr(const, cmd.upper())
-                    key_name = cmd.upper()
-                # Try as raw hex code (4 characters)
-                elif len(cmd) == 4 and all(c in "0123456789ABCDEFabcdef" for c in cmd):
-                    key_code = cmd.upper()
-                    key_name = f"RAW({key_code})"
-                else:
-                    raise ValueError(f"Unknown remote command: {cmd}")
-
+        # Resolve every key before sending, so a bad entry sends nothing
+        key_codes: list[str] = []
+        activity = self._current_activity
+        # Checked per call, since the log level can change at runtime
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for cmd in command:
+            # Normalize command to lowercase for lookup
+            cmd_lower = cmd.lower()
+
+            # Button name or REMOTE_* constant name, in any case
+            if (resolved := RESOLVED_REMOTE_CODES.get(cmd_lower)) is not None:
+                key_name, key_code = resolved
+            # Try as raw hex code (4 characters)
+            elif len(cmd) == 4 and not cmd.strip(HEX_DIGITS):
+                key_code = cmd.upper()
+                key_name = f"RAW({key_code})"
+            else:
+                raise ValueError(f"Unknown remote command: {cmd}")
+
+            if debug:
                 _LOGGER.debug(
                     "Sending remote key %s (%s) to %s",
                     key_name,
                     key_code,
                     self.device.host,
                 )
+            key_codes.append(key_code)
+
+            # Current activity is the last button sent
+            if cmd_lower in REMOTE_BUTTON_MAP:
+                activity = cmd_lower
+
+        if not key_codes:
+            return
 
+        # Use coordinator's lock to prevent conflicts with polling
+        async with self.coordinator.command_lock:
+            for key_code in key_codes:
+                # Keeps the anti-spam spacing between keys of one call too
                 await self._guard_if_needed(COMMAND_GUARD)
 
                 try:
                     await self.device.remote(key_code)
+                except JvcProjectorTimeoutError as err:
+                    # Sent but unacknowledged; the boosted poll shows the outcome
+                    _LOGGER.warning("Remote command not acknowledged: %s", err)
                 except JvcProjectorConnectError as err:
                     _LOGGER.error("Remote command failed: %s", err)
                     raise
 
-                # Update current activity to last sent command
-                if cmd_lower in REMOTE_BUTTON_MAP:
-                    self._current_activity = cmd_lower
+            self._current_activity = activity
+
+        # Pick up whatever the key presses changed without waiting a full interval
+        self.coordinator.boost_next_poll()
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import logging
 
 from .jvcprojector import command, const
+from .jvcprojector.projector import JvcProjectorTimeoutError
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import EntityCategory
@@ -68,6 +69,18 @@ CONTENT_TYPE_PICTURE_MODES = {
     "auto": list(PICTURE_MODE_TO_CODE.keys()),  # All modes when in auto
 }
 
+# Full operation command per option, built once per select entity key
+OPTION_COMMANDS = {
+    const.PMPM: {
+        option: command.PMPM + code for option, code in PICTURE_MODE_TO_CODE.items()
+    },
+    # Input codes: HDMI-1 = '6', HDMI-2 = '7' (from Table 3-6)
+    const.INPUT: {const.HDMI1: f"{command.INPUT}6", const.HDMI2: f"{command.INPUT}7"},
+    const.PMDC: {
+        option: command.PMDC + code for option, code in DYNAMIC_CTRL_TO_CODE.items()
+    },
+}
+
 # Select entities supported by the 2024 LAN spec
 JVC_SELECTS = (
     JVCSelectEntityDescription(
@@ -104,7 +117,12 @@ async def async_setup_entry(
     """Set up JVC Projector select entities from a config entry."""
     coordinator = entry.runtime_data
     async_add_entities(
-        JvcSelect(coordinator, description) for description in JVC_SELECTS
+        [
+            (JvcPictureModeSelect if description.key == const.PMPM else JvcSelect)(
+                coordinator, description
+            )
+            for description in JVC_SELECTS
+        ]
     )
 
 
@@ -121,6 +139,11 @@ class JvcSelect(JvcProjectorEntity, SelectEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
+        self._option_commands = OPTION_COMMANDS.get(description.key, {})
+        self._options_set = frozenset(description.options)
+        # Fixed options are served by SelectEntity without a Python override;
+        # picture mode filters them per content type in its subclass
+        self._attr_options = description.options
 
     @property
     def available(self) -> bool:
@@ -128,7 +151,7 @@ class JvcSelect(JvcProjectorEntity, SelectEntity):
 
         Input and Picture Mode controls are only available when projector is on.
         """
-        if not self.coordinator.last_update_success:
+        if not super().available:
             return False
 
         power = self.coordinator.data.get(const.POWER)
@@ -146,95 +169,68 @@ class JvcSelect(JvcProjectorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        value = self.coordinator.data.get(self.entity_description.key)
+        key = self.entity_description.key
+        value = self.coordinator.data.get(key)
 
         if value is None:
             return None
 
         # Ensure the value is in our options list
-        if value in self.entity_description.options:
+        if value in self._options_set:
             return value
 
         _LOGGER.warning(
             "Unknown %s value: %s",
-            self.entity_description.key,
+            key,
             value,
         )
         return None
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options.
-
-        For picture mode, filter options based on current content type.
-        """
-        if self.entity_description.key != const.PMPM:
-            return self.entity_description.options
-
-        # Get current content type from auto_content_type sensor (PMAT)
-        content_type = self.coordinator.data.get(const.auto_content_type)
-
-        # If content type is not available, return all options
-        if not content_type:
-            return self.entity_description.options
-
-        # Filter picture modes based on content type
-        filtered_modes = CONTENT_TYPE_PICTURE_MODES.get(content_type, [])
-        if not filtered_modes:
-            return self.entity_description.options
-
-        return filtered_modes
+    def _option_allowed(self, option: str) -> bool:
+        """Return if option is currently selectable."""
+        return option in self._options_set
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        key = self.entity_description.key
+
         # Validate against current available options (which may be filtered for picture mode)
-        if option not in self.options:
+        if not self._option_allowed(option):
             _LOGGER.error("Invalid option: %s", option)
             return
 
-        # Get the command code for this option
-        if self.entity_description.key == const.PMPM:
-            code = PICTURE_MODE_TO_CODE.get(option)
-            if not code:
-                _LOGGER.error("No command code for picture mode: %s", option)
-                return
-        elif self.entity_description.key == const.INPUT:
-            # Input codes: HDMI-1 = '6', HDMI-2 = '7' (from Table 3-6)
-            code = "6" if option == const.HDMI1 else "7"
-        elif self.entity_description.key == const.PMDC:
-            code = DYNAMIC_CTRL_TO_CODE.get(option)
-            if not code:
-                _LOGGER.error("No command code for dynamic control: %s", option)
-                return
-        else:
-            _LOGGER.error("Unknown select entity: %s", self.entity_description.key)
+        # Get the full operation command for this option
+        full_command = self._option_commands.get(option)
+        if full_command is None:
+            _LOGGER.error(
+                "No command code for %s option: %s",
+                key,
+                option,
+            )
             return
 
         try:
             # Log the exact command being sent
-            full_command = self.entity_description.command_code + code
             _LOGGER.info(
-                "Sending operation command: %s (option: %s, code: %s)",
-                full_command,
-                option,
-                code,
+                "Sending operation command: %s (option: %s)", full_command, option
             )
 
             # Send the operation command
             # Note: Some projector models may not ACK operation commands
             # or may only support certain operations based on current input signal
             try:
-                await asyncio.wait_for(
-                    self.coordinator.device.op(full_command),
-                    timeout=5.0,  # Shorter timeout for operation commands
-                )
+                # Share the coordinator's session rather than racing a poll
+                async with self.coordinator.command_lock:
+                    # Shorter timeout for operation commands
+                    async with asyncio.timeout(5.0):
+                        await self.coordinator.device.op(full_command)
                 _LOGGER.info(
                     "Successfully set %s to %s (command: %s)",
-                    self.entity_description.key,
+                    key,
                     option,
                     full_command,
                 )
-            except asyncio.TimeoutError:
+            except (TimeoutError, JvcProjectorTimeoutError):
                 # Operation commands may timeout if not supported or if the
                 # selected mode is not valid for the current input signal type
                 _LOGGER.warning(
@@ -245,20 +241,38 @@ class JvcSelect(JvcProjectorEntity, SelectEntity):
                     full_command,
                     option,
                 )
-                # Don't raise - allow the operation to complete silently
-
-            # Brief delay to allow projector to process command
-            # before coordinator refresh attempts to reconnect
-            await asyncio.sleep(2.0)
-
-            # Request a coordinator refresh to update the state
-            await self.coordinator.async_request_refresh()
+                # Don't raise - allow the operation to complete silently;
+                # the next poll (soon) shows what the projector actually did
+                self.coordinator.boost_next_poll()
+            else:
+                # Show the new option right away; the boosted poll, which also
+                # gives the projector time to process the command, confirms it
+                self.coordinator.async_set_optimistic(key, option)
 
         except Exception as err:
             _LOGGER.error(
-                "Failed to set %s to %s (code: %s): %s",
-                self.entity_description.key,
+                "Failed to set %s to %s (command: %s): %s",
+                key,
                 option,
-                code,
+                full_command,
                 err,
             )
+
+
+class JvcPictureModeSelect(JvcSelect):
+    """Picture mode select, whose options follow the detected content type."""
+
+    @property
+    def options(self) -> list[str]:
+        """Return the picture modes available for the current content type."""
+        # Get current content type from auto_content_type sensor (PMAT)
+        # (options are read even while unavailable, before the first poll)
+        content_type = (self.coordinator.data or {}).get(const.auto_content_type)
+
+        # Filter picture modes based on content type; all options when the
+        # content type is unavailable or unknown
+        return CONTENT_TYPE_PICTURE_MODES.get(content_type) or self._attr_options
+
+    def _option_allowed(self, option: str) -> bool:
+        """Return if option is selectable for the current content type."""
+        return option in self.options
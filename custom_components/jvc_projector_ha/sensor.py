@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from typing import Any
 
 from .jvcprojector import const
 
@@ -27,6 +29,47 @@ class JVCSensorEntityDescription(SensorEntityDescription):
     pass
 
 
+_POWER_OFF_STATES = frozenset({const.STANDBY, const.COOLING})
+
+
+def _light_source_time(data: Mapping[str, Any], value: Any) -> int | None:
+    """IFLT (Light Source Time) - parse hours, nothing while the projector is off."""
+    if data.get(const.POWER) in _POWER_OFF_STATES:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _source_display(data: Mapping[str, Any], value: Any) -> str:
+    """IFIS (Source Display) - show "No Signal" when the projector is off."""
+    if data.get(const.POWER) in _POWER_OFF_STATES:
+        return "No Signal"
+    return value
+
+
+def _colorimetry(data: Mapping[str, Any], value: Any) -> str:
+    """IFCM (Colorimetry) - show "no_data" when the projector is off."""
+    if data.get(const.POWER) in _POWER_OFF_STATES:
+        return "no_data"
+    return value
+
+
+def _model(data: Mapping[str, Any], value: Any) -> str:
+    """MODEL - decode internal model codes to actual model names."""
+    return decode_model(value)
+
+
+# Per-key value transforms, resolved once per sensor; other keys pass through
+_VALUE_HANDLERS: dict[str, Callable[[Mapping[str, Any], Any], int | str | None]] = {
+    const.IFLT: _light_source_time,
+    const.IFIS: _source_display,
+    const.IFCM: _colorimetry,
+    const.MODEL: _model,
+}
+
+
 # Sensors supported by the 2024 LAN spec and coordinator
 JVC_SENSORS = (
     # Power state (PW)
@@ -158,7 +201,7 @@ async def async_setup_entry(
     """Set up JVC Projector sensors from a config entry."""
     coordinator = entry.runtime_data
     async_add_entities(
-        JvcSensor(coordinator, description) for description in JVC_SENSORS
+        [JvcSensor(coordinator, description) for description in JVC_SENSORS]
     )
 
 
@@ -175,47 +218,17 @@ class JvcSensor(JvcProjectorEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
+        self._value_handler = _VALUE_HANDLERS.get(description.key)
 
     @property
     def native_value(self) -> int | str | None:
         """Return the sensor value."""
-        value = self.coordinator.data.get(self.entity_description.key)
+        data = self.coordinator.data
+        value = data.get(self.entity_description.key)
 
         if value is None:
             return None
 
-        # IFLT (Light Source Time)
-        if self.entity_description.key == const.IFLT:
-            power = self.coordinator.data.get(const.POWER)
-
-            # Projector is off → explicit state instead of unknown
-            if power in (const.STANDBY, const.COOLING):
-                return None
-
-            # Projector is on → parse hours
-            try:
-                return int(value)
-            except (TypeError, ValueError):
-                return None
-
-        # IFIS (Source Display) - Show "No Signal" when projector is off
-        if self.entity_description.key == const.IFIS:
-            power = self.coordinator.data.get(const.POWER)
-
-            # Projector is off → show "No Signal" instead of Unknown
-            if power in (const.STANDBY, const.COOLING):
-                return "No Signal"
-
-        # IFCM (Colorimetry) - Show "no_data" when projector is off
-        if self.entity_description.key == const.IFCM:
-            power = self.coordinator.data.get(const.POWER)
-
-            # Projector is off → show "no_data" instead of Unknown
-            if power in (const.STANDBY, const.COOLING):
-                return "no_data"
-
-        # MODEL - Decode internal model codes to actual model names
-        if self.entity_description.key == const.MODEL:
-            return decode_model(value)
-
-        return value
+        if self._value_handler is None:
+            return value
+        return self._value_handler(data, value)
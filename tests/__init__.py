@@ -0,0 +1 @@
+"""Tests for the jvc_projector_ha integration."""
@@ -0,0 +1,145 @@
+"""Shared fixtures for the jvc_projector_ha tests."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+import aiodns
+import pytest
+
+# The vendored library does not need Home Assistant. Load it as a top-level
+# package, bypassing the integration's __init__, so its tests run without it.
+_LIBRARY = Path(__file__).parents[1] / "custom_components/jvc_projector_ha/jvcprojector"
+_spec = importlib.util.spec_from_file_location(
+    "jvcprojector", _LIBRARY / "__init__.py", submodule_search_locations=[str(_LIBRARY)]
+)
+assert _spec is not None and _spec.loader is not None
+sys.modules[_spec.name] = _module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+HOST = "192.0.2.10"
+MAC = "E0DADC000001"
+
+# Raw replies of a powered-on projector, by reference code
+ON_REPLIES = {
+    "PW": "1",
+    "IP": "6",
+    "SC": "1",
+    "MD": "ILAFPJ -- B5A2",
+    "LSMA": MAC,
+    "IFLT": "04D2",
+    "IFIS": "0A",
+    "PMPM": "03",
+    "IFIN": "6",
+    "PMAT": "1",
+    "IFCM": "2",
+    "PMCV": "00A0",
+    "PMDC": "1",
+}
+
+
+class FakeProjector:
+    """In-memory projector speaking the LAN protocol over fake streams."""
+
+    def __init__(self) -> None:
+        """Initialize the projector."""
+        self.replies = dict(ON_REPLIES)
+        # Codes never acknowledged, and codes answered only after the next one
+        self.silent: set[str] = set()
+        self.late: set[str] = set()
+        # Sessions opened so far, and every code received over them
+        self.sessions = 0
+        self.received: list[str] = []
+        self.reachable = True
+        self._hang_ups = 0
+
+    def hang_up(self, times: int = 1) -> None:
+        """Close the session instead of answering the next commands."""
+        self._hang_ups = times
+
+    async def open_connection(
+        self, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, _FakeWriter]:
+        """Stand in for asyncio.open_connection()."""
+        if not self.reachable:
+            raise TimeoutError
+        self.sessions += 1
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"PJ_OK")
+        return reader, _FakeWriter(self, reader)
+
+    def receive(self, data: bytes, writer: _FakeWriter) -> None:
+        """Answer data written by the device."""
+        reader = writer.reader
+        if data.startswith(b"PJREQ"):
+            reader.feed_data(b"PJACK")
+            return
+
+        code = data[3:-1].decode()
+        self.received.append(code)
+        if self._hang_ups:
+            self._hang_ups -= 1
+            reader.feed_eof()
+            return
+
+        # A late reply lands just before the answer to the next command
+        answer, writer.late_answer = writer.late_answer, b""
+        if code not in self.silent:
+            # Like the real projector, only the two-character header is echoed
+            header = data[3:5]
+            reply = b"\x06\x89\x01" + header + b"\n"
+            if data.startswith(b"?"):
+                value = self.replies.get(code, "0").encode()
+                reply += b"@\x89\x01" + header + value + b"\n"
+            if code in self.late:
+                writer.late_answer = reply
+            else:
+                answer += reply
+        reader.feed_data(answer)
+
+
+class _FakeResolver:
+    """Resolver answering every lookup with the projector address."""
+
+    async def gethostbyname(self, host: str, family: int) -> SimpleNamespace:
+        """Resolve a host name."""
+        return SimpleNamespace(addresses=[HOST])
+
+
+class _FakeWriter:
+    """Writing end of a fake projector session."""
+
+    def __init__(self, projector: FakeProjector, reader: asyncio.StreamReader) -> None:
+        """Initialize the writer."""
+        self.reader = reader
+        self.late_answer = b""
+        self._projector = projector
+        self._closing = False
+
+    def write(self, data: bytes) -> None:
+        """Send data to the projector."""
+        self._projector.receive(data, self)
+
+    async def drain(self) -> None:
+        """Wait until the data is sent."""
+
+    def close(self) -> None:
+        """Close the session."""
+        self._closing = True
+
+    def is_closing(self) -> bool:
+        """Return True once the session is closed."""
+        return self._closing
+
+
+@pytest.fixture
+def fake_projector(monkeypatch: pytest.MonkeyPatch) -> FakeProjector:
+    """Route projector lookups and connections to a FakeProjector."""
+    projector = FakeProjector()
+    monkeypatch.setattr(aiodns, "DNSResolver", _FakeResolver)
+    monkeypatch.setattr(asyncio, "open_connection", projector.open_connection)
+    return projector
@@ -0,0 +1,182 @@
+"""Tests for the JVC Projector data update coordinator."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.jvc_projector_ha import coordinator as coordinator_module
+from custom_components.jvc_projector_ha.const import DATA_PENDING_DEVICES, DOMAIN
+from custom_components.jvc_projector_ha.coordinator import (
+    BOOST_UPDATE_INTERVAL,
+    IDLE_UPDATE_INTERVAL,
+    UNSUPPORTED_AFTER_MISSES,
+    UPDATE_INTERVAL,
+    JvcProjectorDataUpdateCoordinator,
+)
+from custom_components.jvc_projector_ha.jvcprojector import command, const
+from custom_components.jvc_projector_ha.jvcprojector.projector import JvcProjector
+
+from .conftest import HOST, MAC, FakeProjector
+
+
+async def _setup_coordinator(
+    hass: HomeAssistant, timeout: float = 0.2
+) -> JvcProjectorDataUpdateCoordinator:
+    """Return a coordinator for a projector connected to the fake one."""
+    projector = JvcProjector(HOST, timeout=timeout, persistent=True)
+    await projector.connect(get_info=True)
+    return JvcProjectorDataUpdateCoordinator(hass, projector)
+
+
+async def test_session_is_held_between_polls(
+    hass: HomeAssistant, fake_projector: FakeProjector
+) -> None:
+    """Polls reuse the session opened when connecting."""
+    coordinator = await _setup_coordinator(hass)
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data[const.POWER] == const.ON
+    assert coordinator.data[const.IFLT] == 1234
+    assert coordinator.update_interval == UPDATE_INTERVAL
+    assert fake_projector.sessions == 1
+
+    await coordinator.async_shutdown()
+
+
+async def test_standby_polls_at_idle_interval(
+    hass: HomeAssistant, fake_projector: FakeProjector
+) -> None:
+    """A projector in standby is polled less often and skips the ON refs."""
+    fake_projector.replies[command.POWER] = "0"
+    coordinator = await _setup_coordinator(hass)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data[const.POWER] == const.STANDBY
+    assert coordinator.data[const.IFLT] == "power_off"
+    assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
+    assert command.IFLT not in fake_projector.received
+
+    await coordinator.async_shutdown()
+
+
+async def test_optimistic_value_is_confirmed_by_boosted_poll(
+    hass: HomeAssistant, fake_projector: FakeProjector
+) -> None:
+    """An optimistic value shows at once and the boosted poll replaces it."""
+    coordinator = await _setup_coordinator(hass)
+    await coordinator.async_refresh()
+
+    coordinator.async_set_optimistic(const.POWER, const.COOLING)
+    assert coordinator.data[const.POWER] == const.COOLING
+    assert coordinator.update_interval == BOOST_UPDATE_INTERVAL
+
+    await coordinator.async_refresh()
+    assert coordinator.data[const.POWER] == const.ON
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    await coordinator.async_shutdown()
+
+
+
+async def test_failed_boosted_poll_restores_interval(
+    hass: HomeAssistant, fake_projector: FakeProjector
+) -> None:
+    """A boost lasts one poll even when the projector cannot be reached."""
+    coordinator = await _setup_coordinator(hass)
+    await coordinator.async_refresh()
+
+    # The projector drops the session and stops accepting new ones
+    fake_projector.hang_up()
+    fake_projector.reachable = False
+
+    coordinator.boost_next_poll()
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    await coordinator.async_shutdown()
+
+async def test_silent_refs_are_backed_off(
+    hass: HomeAssistant, fake_projector: FakeProjector
+) -> None:
+    """Two references left unanswered every poll both end up unsupported."""
+    fake_projector.silent |= {command.IFCM, command.PMDC}
+    coordinator = await _setup_coordinator(hass)
+
+    for _ in range(UNSUPPORTED_AFTER_MISSES):
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        # The reference between the silent ones is still answered
+        assert coordinator.data[const.PMCV] == "160"
+
+    assert coordinator.unsupported_commands == [command.IFCM, command.PMDC]
+
+    # Backed-off references are no longer sent
+    fake_projector.received.clear()
+    await coordinator.async_refresh()
+    assert command.IFCM not in fake_projector.received
+    assert command.PMDC not in fake_projector.received
+
+    await coordinator.async_shutdown()
+
+
+async def test_ref_silent_past_poll_timeout_is_backed_off(
+    hass: HomeAssistant,
+    fake_projector: FakeProjector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A reference outlasting the poll fails the poll but still backs off."""
+    monkeypatch.setattr(coordinator_module, "POLL_TIMEOUT", 3)
+    fake_projector.silent.add(command.PMDC)
+    coordinator = await _setup_coordinator(hass, timeout=10)
+
+    for _ in range(UNSUPPORTED_AFTER_MISSES):
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+
+    assert coordinator.unsupported_commands == [command.PMDC]
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+    await coordinator.async_shutdown()
+
+
+async def test_setup_takes_over_the_probed_device(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    fake_projector: FakeProjector,
+) -> None:
+    """Setup polls over the config flow's session instead of a new one."""
+    projector = JvcProjector(HOST, timeout=0.2, persistent=True)
+    await projector.connect(get_info=True)
+    hass.data.setdefault(DOMAIN, {})[DATA_PENDING_DEVICES] = {HOST: projector}
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=MAC,
+        data={CONF_HOST: HOST, CONF_PORT: 20554, CONF_PASSWORD: None},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.device is projector
+    assert not hass.data[DOMAIN][DATA_PENDING_DEVICES]
+    assert fake_projector.sessions == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
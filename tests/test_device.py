@@ -0,0 +1,99 @@
+"""Tests for the vendored JVC Projector library sessions, without Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+
+from jvcprojector import JvcProjector, JvcProjectorTimeoutError
+import pytest
+
+from .conftest import HOST, FakeProjector
+
+
+async def _connect(timeout: float = 0.2) -> JvcProjector:
+    """Return a persistent projector connected to the fake one."""
+    projector = JvcProjector(HOST, timeout=timeout, persistent=True)
+    await projector.connect(get_info=True)
+    return projector
+
+
+def test_persistent_session_is_reused(fake_projector: FakeProjector) -> None:
+    """Commands after connect share the session opened by connect."""
+
+    async def scenario() -> None:
+        projector = await _connect()
+        assert projector.model == "ILAFPJ -- B5A2"
+        assert (await projector.get_state())["power"] == "on"
+        assert await projector.ref("IFIS") == "1080p60"
+        await projector.disconnect()
+
+    asyncio.run(scenario())
+    assert fake_projector.sessions == 1
+
+
+def test_closed_session_is_reopened_once(fake_projector: FakeProjector) -> None:
+    """A session the projector closed is reopened and the command resent."""
+
+    async def scenario() -> None:
+        projector = await _connect()
+        fake_projector.hang_up()
+        assert await projector.ref("PMPM") == "natural"
+
+        # A fresh session failing as well is not retried again
+        fake_projector.hang_up(2)
+        with pytest.raises(ConnectionResetError):
+            await projector.ref("PMPM")
+        await projector.disconnect()
+
+    asyncio.run(scenario())
+    assert fake_projector.sessions == 3
+
+
+def test_timeout_drops_the_session(fake_projector: FakeProjector) -> None:
+    """A late reply is not read as the answer to the next command."""
+    fake_projector.late.add("IFLT")
+
+    async def scenario() -> None:
+        projector = await _connect()
+        with pytest.raises(JvcProjectorTimeoutError):
+            await projector.ref("IFLT")
+        # IFIS shares the IF header, so a reused session would read the IFLT reply
+        assert await projector.ref("IFIS") == "1080p60"
+        await projector.disconnect()
+
+    asyncio.run(scenario())
+    assert fake_projector.sessions == 2
+
+
+def test_pipeline_skips_silent_refs(fake_projector: FakeProjector) -> None:
+    """Silent references yield None without losing the ones after them."""
+    fake_projector.silent |= {"IFCM", "PMDC"}
+    unanswered: list[str] = []
+
+    async def scenario() -> list[str | None]:
+        projector = await _connect()
+        responses = await projector.pipeline(["IFCM", "PMCV", "PMDC"], unanswered)
+        await projector.disconnect()
+        return responses
+
+    assert asyncio.run(scenario()) == [None, "160", None]
+    assert unanswered == ["IFCM", "PMDC"]
+
+
+def test_pipeline_reports_awaited_ref_on_cancel(
+    fake_projector: FakeProjector,
+) -> None:
+    """A batch cut short by the caller reports the reference it awaited."""
+    fake_projector.silent.add("PMDC")
+    unanswered: list[str] = []
+
+    async def scenario() -> None:
+        projector = await _connect(timeout=5)
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(1):
+                await projector.pipeline(["PMCV", "PMDC", "IFCM"], unanswered)
+        await projector.disconnect()
+
+    asyncio.run(scenario())
+    assert unanswered == ["PMDC"]
+    assert "IFCM" not in fake_projector.received